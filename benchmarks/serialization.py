@@ -0,0 +1,139 @@
+"""List endpoint serialization cost per page, without a database.
+
+FastAPI validates a returned page against its response_model again and runs
+the result through the default JSON encoder; json_response dumps the page the
+service already validated straight to JSON bytes with pydantic-core. This
+builds pages of detached ORM rows and measures both paths:
+
+    python -m benchmarks.serialization --count 2000 --size 50
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from time import perf_counter
+from typing import Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+from sqlalchemy.orm import configure_mappers
+
+from source.app.games.models import Game
+from source.app.games.schemas import GamePage
+from source.app.profiles.models import Profile
+from source.app.profiles.schemas import ProfilePage
+from source.app.rooms.models import Room
+from source.app.rooms.schemas import RoomPage
+from source.app.users.enums import Roles
+from source.app.users.models import User
+from source.app.users.schemas import UserPage
+from source.core.utils import json_response
+
+now = datetime.utcnow()
+
+
+def make_game(index: int) -> Game:
+    return Game(
+        id=index,
+        game_name=f"game {index}",
+        game_description="description",
+        game_ranks=["bronze", "silver", "gold"],
+        game_logo="logo.png",
+        create_date=now,
+        update_date=now,
+    )
+
+
+def make_user(index: int) -> User:
+    return User(
+        id=index,
+        username=f"user{index}",
+        email=f"user{index}@example.com",
+        first_name="first",
+        last_name="last",
+        active=True,
+        role=Roles.USER,
+        create_date=now,
+        update_date=now,
+    )
+
+
+def make_room(index: int) -> Room:
+    room = Room(
+        id=index,
+        game_id=index,
+        owner_id=index,
+        room_name=f"room {index}",
+        room_description="description",
+        room_ranks=["silver"],
+        room_size=5,
+        create_date=now,
+        update_date=now,
+    )
+    room.users = [make_user(index * 5 + member) for member in range(3)]
+    return room
+
+
+def make_profile(index: int) -> Profile:
+    profile = Profile(
+        id=index,
+        user_nickname=f"nickname {index}",
+        user_rank="silver",
+        create_date=now,
+        update_date=now,
+    )
+    profile.game = make_game(index)
+    return profile
+
+
+pages: dict[str, tuple[type[BaseModel], str, Callable]] = {
+    "rooms": (RoomPage, "rooms", make_room),
+    "users": (UserPage, "users", make_user),
+    "games": (GamePage, "games", make_game),
+    "profiles": (ProfilePage, "profiles", make_profile),
+}
+
+
+async def default_path(page: BaseModel, field) -> bytes:
+    content = await serialize_response(
+        field=field, response_content=page, is_coroutine=True
+    )
+    return JSONResponse(content=content).body
+
+
+async def fast_path(page: BaseModel, field) -> bytes:
+    return json_response(content=page).body
+
+
+async def measure(
+    serialize: Callable, schema: type[BaseModel], key: str, rows: list, count: int
+) -> float:
+    field = create_response_field(name="response", type_=schema)
+    start = perf_counter()
+    for _ in range(count):
+        page = schema(**{key: rows}, page=1, size=len(rows), total=100, pages=2)
+        await serialize(page, field)
+    return (perf_counter() - start) / count * 1e6
+
+
+async def run(count: int, size: int) -> None:
+    configure_mappers()
+    print(f"{'page':<12}{'default':>12}{'fast':>12}  (us/page of {size})")
+    for name, (schema, key, make) in pages.items():
+        rows = [make(index) for index in range(1, size + 1)]
+        default = await measure(default_path, schema, key, rows, count)
+        fast = await measure(fast_path, schema, key, rows, count)
+        print(f"{name:<12}{default:>12.1f}{fast:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(count=args.count, size=args.size))
+
+
+if __name__ == "__main__":
+    main()
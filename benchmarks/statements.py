@@ -0,0 +1,77 @@
+"""Per-execution statement overhead for the hot queries, without a database.
+
+Every execute builds the statement and derives its cache key before the
+compiled SQL can be reused; a cache miss compiles from scratch. This measures
+those steps for plain select() constructs and for the lambda statements in
+the apps' queries modules:
+
+    python -m benchmarks.statements --count 20000
+"""
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import configure_mappers, selectinload
+
+from source.app.profiles.models import Profile
+from source.app.profiles.queries import profile_by_user_game
+from source.app.rooms.models import Room
+from source.app.rooms.queries import room_by_id, room_with_users
+from source.app.users.models import User
+from source.app.users.queries import user_by_id
+
+queries: dict[str, tuple[Callable, Callable]] = {
+    "user by id": (
+        lambda index: select(User).where(User.id == index),
+        lambda index: user_by_id(user_id=index),
+    ),
+    "room by id": (
+        lambda index: select(Room).where(Room.id == index),
+        lambda index: room_by_id(room_id=index),
+    ),
+    "room with users": (
+        lambda index: select(Room)
+        .where(Room.id == index)
+        .options(selectinload(Room.users)),
+        lambda index: room_with_users(room_id=index),
+    ),
+    "profile by user and game": (
+        lambda index: select(Profile)
+        .where(Profile.user_id == index)
+        .where(Profile.game_id == index),
+        lambda index: profile_by_user_game(user_id=index, game_id=index),
+    ),
+}
+
+
+def measure(build: Callable, count: int, compile: bool = False) -> float:
+    dialect = postgresql.asyncpg.dialect()
+    start = perf_counter()
+    for index in range(count):
+        statement = build(index)
+        if compile:
+            statement.compile(dialect=dialect)
+        else:
+            statement._generate_cache_key()
+    return (perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+    configure_mappers()
+    print(f"{'query':<26}{'compile':>10}{'select':>10}{'lambda':>10}  (us/call)")
+    for name, (plain, cached) in queries.items():
+        print(
+            f"{name:<26}"
+            f"{measure(plain, count=args.count // 10, compile=True):>10.1f}"
+            f"{measure(plain, count=args.count):>10.1f}"
+            f"{measure(cached, count=args.count):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
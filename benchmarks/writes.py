@@ -0,0 +1,65 @@
+"""Game create/update throughput, with and without post-commit refreshes.
+
+Run against a disposable database:
+
+    python -m benchmarks.writes --count 1000
+    python -m benchmarks.writes --count 1000 --refresh
+"""
+import argparse
+import asyncio
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from source.app.games.models import Game
+from source.app.games.schemas import GameResponse
+from source.core.database import get_engine
+
+
+async def run(count: int, refresh: bool) -> float:
+    engine = get_engine()
+    sessions = async_sessionmaker(bind=engine, expire_on_commit=refresh)
+    prefix = f"benchmark-{uuid4().hex[:8]}"
+    try:
+        async with sessions() as db:
+            start = perf_counter()
+            for index in range(count):
+                game = Game(
+                    game_name=f"{prefix}-{index}",
+                    game_description="created",
+                    game_ranks=[],
+                    game_logo="",
+                )
+                db.add(game)
+                await db.commit()
+                if refresh:
+                    await db.refresh(game)
+                GameResponse.model_validate(game)
+                game.game_description = "updated"
+                await db.commit()
+                if refresh:
+                    await db.refresh(game)
+                GameResponse.model_validate(game)
+            return perf_counter() - start
+    finally:
+        async with sessions() as db:
+            await db.execute(delete(Game).where(Game.game_name.startswith(prefix)))
+            await db.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--refresh", action="store_true")
+    args = parser.parse_args()
+    elapsed = asyncio.run(run(count=args.count, refresh=args.refresh))
+    writes = args.count * 2
+    mode = "refresh" if args.refresh else "returning"
+    print(f"{mode}: {writes} writes in {elapsed:.2f}s, {writes / elapsed:.0f} writes/s")
+
+
+if __name__ == "__main__":
+    main()
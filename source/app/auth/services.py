@@ -13,7 +13,8 @@ from source.app.auth.enums import TokenType
 from source.app.auth.utils import verify_password
 from source.app.users.enums import Roles
 from source.app.users.models import User
-from source.core.database import get_db
+from source.app.users.queries import user_by_id
+from source.core.database import SessionLocal, get_db
 from source.core.exceptions import forbidden, unauthorized
 from source.core.settings import settings
 
@@ -43,7 +44,7 @@ async def authenticate_token(
     password_timestamp: float,
     db: AsyncSession,
 ) -> User | None:
-    user: User | None = await db.get(User, user_id)
+    user: User | None = await db.scalar(user_by_id(user_id=user_id))
     if user and password_timestamp == user.password_timestamp:
         return await validate_user(user=user)
     return None
@@ -140,3 +141,12 @@ async def auth_admin(
     if not token:
         return unauthorized("Invalid Authorization Header")
     return await authenticate(token=token.credentials, db=db, roles=[Roles.ADMIN.value])
+
+
+async def auth_socket(
+    token: HTTPAuthorizationCredentials = Security(CustomHTTPBearer(auto_error=False)),
+) -> User:
+    if not token:
+        return unauthorized("Invalid Authorization Header")
+    async with SessionLocal() as db:
+        return await authenticate(token=token.credentials, db=db)
@@ -1,5 +1,13 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
 from passlib.context import CryptContext
 
+from source.core.settings import settings
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -9,3 +17,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def get_password_hashes(passwords: list[str]) -> list[str]:
+    return [get_password_hash(password) for password in passwords]
+
+
+def get_hash_workers() -> int:
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+@cache
+def get_hash_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=get_hash_workers(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    workers = get_hash_workers()
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                get_hash_executor(), get_password_hashes, passwords[offset::workers]
+            )
+            for offset in range(min(workers, len(passwords)))
+        )
+    )
+    hashes = [""] * len(passwords)
+    for offset, chunk in enumerate(chunks):
+        hashes[offset::workers] = chunk
+    return hashes
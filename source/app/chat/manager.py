@@ -1,20 +1,37 @@
+import asyncio
+import json
+import logging
+from collections import Counter
+
 from fastapi.websockets import WebSocket
 
+from source.core import metrics, notifications
+
+logger = logging.getLogger(__name__)
+
 rooms: dict = {}
+broadcasts = metrics.Counter()
 
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections = []
+        self.games: Counter = Counter()
+        self.relayed: asyncio.Queue = asyncio.Queue()
+        self.task: asyncio.Task | None = None
 
-    async def connect(self, websocket: WebSocket, room_id: str, nickname: str):
+    async def connect(
+        self, websocket: WebSocket, room_id: str, nickname: str, game_id: int
+    ):
         await websocket.accept()
         connection_info = {
             "websocket": websocket,
             "room_id": room_id,
             "nickname": nickname,
+            "game_id": game_id,
         }
         self.active_connections.append(connection_info)
+        self.games[game_id] += 1
         rooms.setdefault(room_id, []).append(connection_info)
         await self.broadcast_message(
             message=f"{nickname} joined the room",
@@ -34,18 +51,63 @@ class ConnectionManager:
         if connection_info:
             self.active_connections.remove(connection_info)
             rooms[room_id].remove(connection_info)
+            self.games[connection_info["game_id"]] -= 1
 
     @staticmethod
     async def send_personal_message(message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     @staticmethod
-    async def broadcast_message(
-        message: str, room_id: str, sender_websocket: WebSocket
+    async def deliver_message(
+        message: str, room_id: str, sender_websocket: WebSocket | None = None
     ):
-        for connection in rooms.get(room_id, []):
-            if connection["websocket"] != sender_websocket:
+        for connection in list(rooms.get(room_id, [])):
+            if connection["websocket"] == sender_websocket:
+                continue
+            try:
                 await connection["websocket"].send_text(message)
+            except Exception:
+                logger.debug("Chat delivery to a closed socket skipped")
+                continue
+            broadcasts.inc()
+
+    async def broadcast_message(
+        self, message: str, room_id: str, sender_websocket: WebSocket
+    ):
+        await self.deliver_message(
+            message=message, room_id=room_id, sender_websocket=sender_websocket
+        )
+        await notifications.publish(
+            channel="chat",
+            payload=json.dumps(
+                {
+                    "origin": notifications.origin,
+                    "room_id": room_id,
+                    "message": message,
+                },
+                ensure_ascii=False,
+            ),
+        )
+
+    def relay_message(self, payload: str | None) -> None:
+        if payload is None:
+            return
+        message = json.loads(payload)
+        if message["origin"] == notifications.origin or not rooms.get(
+            message["room_id"]
+        ):
+            return
+        self.relayed.put_nowait(message)
+        if not self.task or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    async def run(self):
+        while not self.relayed.empty():
+            message = self.relayed.get_nowait()
+            await self.deliver_message(
+                message=message["message"], room_id=message["room_id"]
+            )
 
 
 manager = ConnectionManager()
+notifications.listen("chat", manager.relay_message)
@@ -1,18 +1,17 @@
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from source.app.profiles.models import Profile
-from source.app.rooms.models import Room
+from source.app.profiles.cache import nicknames
+from source.app.rooms.queries import room_game_id
 from source.app.users.models import User
 
 
-async def get_nickname(user: User, db: AsyncSession):
+async def get_nickname(user: User, db: AsyncSession) -> tuple[str, int] | None:
     if not user.room_id:
         return None
-    room = await db.scalar(select(Room).where(Room.id == user.room_id))
-    profile = await db.scalar(
-        select(Profile)
-        .where(Profile.user_id == user.id)
-        .where(Profile.game_id == room.game_id)
-    )
-    return profile.user_nickname
+    game_id = await db.scalar(room_game_id(room_id=user.room_id))
+    if game_id is None:
+        return None
+    if entry := await nicknames.get(user_id=user.id, game_id=game_id, db=db):
+        nickname, _ = entry
+        return nickname, game_id
+    return None
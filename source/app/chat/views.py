@@ -1,29 +1,37 @@
-from fastapi import Depends
 from fastapi.websockets import WebSocket, WebSocketDisconnect
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from source.app.auth.auth import CurrentUser
+from source.app.auth.auth import SocketUser
 from source.app.chat.manager import manager
 from source.app.chat.services import get_nickname
-from source.core.database import get_db
+from source.core.database import SessionLocal
 from source.core.middlewares import CustomAPIRouter
+from source.core.settings import settings
 
 chat_router = CustomAPIRouter(prefix="/chat")
 
 
 @chat_router.websocket("")
 @chat_router.websocket("/")
-async def websocket_endpoint(
-    user: CurrentUser, websocket: WebSocket, db: AsyncSession = Depends(get_db)
-):
-    nickname = await get_nickname(user=user, db=db)
-    if not nickname:
+async def websocket_endpoint(user: SocketUser, websocket: WebSocket):
+    async with SessionLocal() as db:
+        profile = await get_nickname(user=user, db=db)
+    if not profile:
         return None
+    nickname, game_id = profile
 
-    await manager.connect(websocket=websocket, room_id=user.room_id, nickname=nickname)
+    await manager.connect(
+        websocket=websocket, room_id=user.room_id, nickname=nickname, game_id=game_id
+    )
     try:
         while True:
             data = await websocket.receive_text()
+            if len(data.encode()) > settings.CHAT_MESSAGE_MAX_BYTES:
+                await manager.send_personal_message(
+                    message=f"Message is longer than "
+                    f"{settings.CHAT_MESSAGE_MAX_BYTES} bytes",
+                    websocket=websocket,
+                )
+                continue
             await manager.broadcast_message(
                 message=f"{nickname}: {data}",
                 room_id=user.room_id,
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Export(str, Enum):
+    USERS = "users"
+    PROFILES = "profiles"
+    ROOMS = "rooms"
@@ -0,0 +1,43 @@
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import Column, select
+
+from source.app.profiles.models import Profile
+from source.app.rooms.models import Room
+from source.app.users.models import User
+from source.core.database import SessionLocal
+from source.core.settings import settings
+
+exports: dict[str, list[Column]] = {
+    "users": [column for column in User.__table__.c if column.key != "password"],
+    "profiles": list(Profile.__table__.c),
+    "rooms": list(Room.__table__.c),
+}
+
+
+def serialize(value: datetime) -> str:
+    return value.isoformat()
+
+
+async def export_rows(columns: list[Column]) -> AsyncIterator[bytes]:
+    async with SessionLocal() as db:
+        result = await db.stream(
+            select(*columns)
+            .order_by(columns[0].table.c.id)
+            .execution_options(yield_per=settings.EXPORT_CHUNK)
+        )
+        async for rows in result.partitions():
+            yield "".join(
+                json.dumps(row._asdict(), default=serialize) + "\n" for row in rows
+            ).encode()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,37 @@
+from fastapi import Request, status
+from fastapi.responses import StreamingResponse
+
+from source.app.auth.auth import Admin
+from source.app.exports.enums import Export
+from source.app.exports.services import export_rows, exports, gzip_chunks
+from source.core.middlewares import CustomAPIRouter
+from source.core.schemas import ExceptionSchema
+from source.core.utils import accepts_encoding
+
+exports_router = CustomAPIRouter(prefix="/export")
+
+
+@exports_router.get(
+    "/{export}",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"application/x-ndjson": {}}},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+    },
+    tags=["export"],
+)
+async def export_admin(
+    user: Admin, export: Export, request: Request
+) -> StreamingResponse:
+    chunks = export_rows(columns=exports[export])
+    headers = {
+        "Content-Disposition": f'attachment; filename="{export.value}.ndjson"',
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_encoding(request.headers.get("Accept-Encoding", ""), "gzip"):
+        chunks = gzip_chunks(chunks=chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        content=chunks, media_type="application/x-ndjson", headers=headers
+    )
@@ -0,0 +1,101 @@
+import asyncio
+from math import ceil
+from time import monotonic
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.app.games.enums import Order, Sort
+from source.app.games.models import Game
+from source.app.games.schemas import GamePage, GameResponse
+from source.core.metrics import Counter
+from source.core.notifications import listen
+from source.core.settings import settings
+from source.core.utils import make_etag
+
+
+class GameCatalog:
+    def __init__(self):
+        self.version = 0
+        self.loaded_at = 0.0
+        self.games: tuple[GameResponse, ...] | None = None
+        self.records: dict[int, tuple[bytes, str]] = {}
+        self.pages: dict[tuple, bytes] = {}
+        self.etag = ""
+        self.lock = asyncio.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def invalidate(self, payload: str | None = None) -> None:
+        self.version += 1
+        self.games = None
+        self.records = {}
+        self.pages = {}
+
+    def fresh(self) -> bool:
+        return (
+            self.games is not None
+            and monotonic() - self.loaded_at < settings.GAMES_CACHE_TTL
+        )
+
+    async def load(self, db: AsyncSession) -> None:
+        async with self.lock:
+            while not self.fresh():
+                version = self.version
+                games = tuple(
+                    GameResponse.model_validate(game)
+                    for game in await db.scalars(select(Game).order_by(Game.id))
+                )
+                if version != self.version:
+                    continue
+                contents = [game.model_dump_json().encode() for game in games]
+                self.records = {
+                    game.id: (content, make_etag(content))
+                    for game, content in zip(games, contents)
+                }
+                self.etag = make_etag(b",".join(contents))
+                self.games, self.pages, self.loaded_at = games, {}, monotonic()
+
+    async def get(self, game_id: int, db: AsyncSession) -> tuple[bytes, str] | None:
+        if not self.fresh():
+            self.misses.inc()
+            await self.load(db=db)
+        else:
+            self.hits.inc()
+        return self.records.get(game_id)
+
+    async def page(
+        self, page: int, size: int, sort: Sort, order: Order, db: AsyncSession
+    ) -> bytes:
+        if not self.fresh():
+            self.misses.inc()
+            await self.load(db=db)
+        else:
+            self.hits.inc()
+        key = (page, size, sort, order)
+        if (content := self.pages.get(key)) is None:
+            start, stop = (page - 1) * size, page * size
+            games = sorted(
+                self.games or (),
+                key=lambda game: getattr(game, sort.value),
+                reverse=order == Order.DESC,
+            )
+            content = (
+                GamePage(
+                    games=games[start:stop],
+                    page=page,
+                    size=size,
+                    total=len(games),
+                    pages=ceil(len(games) / size),
+                )
+                .model_dump_json()
+                .encode()
+            )
+            if len(self.pages) >= settings.GAMES_CACHE_PAGES:
+                self.pages.clear()
+            self.pages[key] = content
+        return content
+
+
+catalog = GameCatalog()
+listen("games", catalog.invalidate)
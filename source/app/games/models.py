@@ -1,9 +1,10 @@
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ARRAY, String
+from sqlalchemy import ARRAY, ForeignKey, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from source.core.models import Model
+from source.core.models import Base, Model
 
 if TYPE_CHECKING:
     from source.app.profiles.models import Profile
@@ -21,7 +22,25 @@ class Game(Model):
     game_ranks: Mapped[list[str]] = mapped_column(ARRAY(String))
     game_logo: Mapped[str]
 
-    rooms: Mapped[list[Room]] = relationship(cascade="all, delete-orphan")
+    rooms: Mapped[list[Room]] = relationship(
+        cascade="all, delete-orphan", passive_deletes=True
+    )
     profiles: Mapped[list[Profile]] = relationship(
-        back_populates="game", cascade="all, delete-orphan"
+        back_populates="game", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+
+class GameStats(Base):
+    __tablename__ = "GameStats"
+
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("Games.id", ondelete="CASCADE"), primary_key=True
+    )
+    profiles: Mapped[int] = mapped_column(default=0, server_default="0")
+    rooms: Mapped[int] = mapped_column(default=0, server_default="0")
+    players: Mapped[int] = mapped_column(default=0, server_default="0")
+    reconciled_at: Mapped[datetime | None]
+    reconciled_snapshot: Mapped[str | None]
+    update_date: Mapped[datetime] = mapped_column(
+        default=func.now(), onupdate=func.now()
     )
@@ -36,3 +36,11 @@ class GamePagination(PaginationSchema):
 
 class GameId(BaseModel):
     game_id: int
+
+
+class GameStatsResponse(BaseModel):
+    game_id: int
+    profiles: int
+    rooms: int
+    players: int
+    chatting: int
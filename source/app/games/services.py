@@ -1,13 +1,17 @@
-from math import ceil
-
-from sqlalchemy import asc, desc, select
+from sqlalchemy import delete
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from source.app.games.enums import Order, Sort
-from source.app.games.models import Game
-from source.app.games.schemas import GamePage, GameRequest, GameUpdateRequest
+from source.app.games.cache import catalog
+from source.app.games.models import Game, GameStats
+from source.app.games.schemas import GameRequest, GameStatsResponse, GameUpdateRequest
+from source.app.games.stats import counters
+from source.app.rooms.enums import RoomEvent
+from source.app.rooms.models import Room
+from source.app.rooms.services import publish_room
+from source.app.system.services import get_chatting
 from source.core.exceptions import conflict
+from source.core.notifications import notify
 
 
 async def get_game(game_id: int, db: AsyncSession) -> Game | None:
@@ -18,8 +22,10 @@ async def create_game(request: GameRequest, db: AsyncSession) -> Game | None:
     try:
         game = Game(**request.model_dump())
         db.add(game)
+        await db.flush()
+        await notify(channel="games", payload=str(game.id), db=db)
         await db.commit()
-        await db.refresh(game)
+        catalog.invalidate()
         return game
     except IntegrityError:
         return None
@@ -36,8 +42,9 @@ async def update_game(
             for key, value in fields_to_update:
                 if value is not None:
                     setattr(game, key, value)
+            await notify(channel="games", payload=str(game_id), db=db)
             await db.commit()
-            await db.refresh(game)
+            catalog.invalidate()
             return game
         except IntegrityError:
             return conflict(f"Game '{payload.game_name}' already exists")
@@ -45,29 +52,42 @@ async def update_game(
 
 
 async def delete_game(game_id: int, db: AsyncSession) -> bool:
-    if game := await get_game(game_id=game_id, db=db):
-        await db.delete(game)
-        await db.commit()
-        return True
-    return False
-
-
-async def list_games(
-    page: int, size: int, sort: Sort, order: Order, db: AsyncSession
-) -> GamePage:
-    order = asc(sort) if order == Order.ASC else desc(sort)
-
-    games = (
+    room_ids = (
         await db.scalars(
-            select(Game).order_by(order).offset((page - 1) * size).limit(size)
+            delete(Room)
+            .where(Room.game_id == game_id)
+            .returning(Room.id)
+            .execution_options(synchronize_session=False)
         )
     ).all()
-    total = len(games)
+    result = await db.execute(
+        delete(Game)
+        .where(Game.id == game_id)
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        await db.rollback()
+        return False
+    await notify(channel="games", payload=str(game_id), db=db)
+    await db.commit()
+    catalog.invalidate()
+    counters.discard(game_id=game_id)
+    for room_id in room_ids:
+        await publish_room(
+            event=RoomEvent.DELETED, room_id=room_id, game_id=game_id, db=db
+        )
+    return True
 
-    return GamePage(
-        games=games,
-        page=page,
-        size=size,
-        total=total,
-        pages=(ceil(total / size)),
+
+async def get_game_stats(game_id: int, db: AsyncSession) -> GameStatsResponse | None:
+    stats = await db.get(GameStats, game_id)
+    if not stats and not await catalog.get(game_id=game_id, db=db):
+        return None
+    pending = counters.pending(game_id=game_id)
+    return GameStatsResponse(
+        game_id=game_id,
+        profiles=(stats.profiles if stats else 0) + pending["profiles"],
+        rooms=(stats.rooms if stats else 0) + pending["rooms"],
+        players=(stats.players if stats else 0) + pending["players"],
+        chatting=get_chatting(game_id=game_id),
     )
@@ -0,0 +1,188 @@
+from collections import Counter
+from datetime import timedelta
+
+from sqlalchemy import Integer, String, cast, column, event, func, or_, select, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.types import UserDefinedType
+
+from source.app.games.models import Game, GameStats
+from source.app.profiles.models import Profile
+from source.app.rooms.models import Room
+from source.app.users.models import User
+from source.core.settings import settings
+
+fields = ("profiles", "rooms", "players")
+lock = 0x73746174
+chunk = 5000
+
+
+class XID8(UserDefinedType):
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        return "xid8"
+
+
+class Snapshot(UserDefinedType):
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        return "pg_snapshot"
+
+
+class GameCounters:
+    def __init__(self):
+        self.deltas: dict[int, dict[str, Counter]] = {}
+
+    def add(self, db: AsyncSession, game_id: int, **deltas: int) -> None:
+        staged = db.info.setdefault("game_stats", {})
+        staged.setdefault(game_id, Counter()).update(deltas)
+
+    def stamp(self, session: Session) -> None:
+        if session.info.get("game_stats"):
+            session.info["game_stats_xid"] = session.scalar(
+                select(cast(func.pg_current_xact_id(), String))
+            )
+
+    def commit(self, session: Session) -> None:
+        staged = session.info.pop("game_stats", None)
+        xid = session.info.pop("game_stats_xid", None)
+        if staged and xid:
+            self.record(
+                deltas={game_id: {xid: delta} for game_id, delta in staged.items()}
+            )
+
+    def rollback(self, session: Session) -> None:
+        session.info.pop("game_stats", None)
+        session.info.pop("game_stats_xid", None)
+
+    def record(self, deltas: dict[int, dict[str, Counter]]) -> None:
+        for game_id, transactions in deltas.items():
+            current = self.deltas.setdefault(game_id, {})
+            for xid, delta in transactions.items():
+                current.setdefault(xid, Counter()).update(delta)
+
+    def discard(self, game_id: int) -> None:
+        self.deltas.pop(game_id, None)
+
+    def pending(self, game_id: int) -> Counter:
+        total: Counter = Counter()
+        for delta in self.deltas.get(game_id, {}).values():
+            total.update(delta)
+        return total
+
+    async def flush(self, db: AsyncSession) -> None:
+        deltas, self.deltas = self.deltas, {}
+        rows = [
+            (game_id, xid, *(delta[field] for field in fields))
+            for game_id, transactions in deltas.items()
+            for xid, delta in transactions.items()
+            if any(delta.values())
+        ]
+        if not rows:
+            return
+        try:
+            await db.execute(select(func.pg_advisory_xact_lock_shared(lock)))
+            for start in range(0, len(rows), chunk):
+                stop = start + chunk
+                await self.write(rows=rows[start:stop], db=db)
+            await db.commit()
+        except BaseException:
+            self.record(deltas)
+            raise
+
+    async def write(self, rows: list[tuple], db: AsyncSession) -> None:
+        data = values(
+            column("game_id", Integer),
+            column("xid", String),
+            *(column(field, Integer) for field in fields),
+            name="deltas",
+        ).data(rows)
+        counted = func.pg_visible_in_snapshot(
+            cast(data.c.xid, XID8()), cast(GameStats.reconciled_snapshot, Snapshot())
+        )
+        query = insert(GameStats).from_select(
+            ["game_id", *fields],
+            select(data.c.game_id, *(func.sum(data.c[field]) for field in fields))
+            .select_from(data)
+            .join(Game, Game.id == data.c.game_id)
+            .outerjoin(GameStats, GameStats.game_id == data.c.game_id)
+            .where(or_(GameStats.reconciled_snapshot.is_(None), ~counted))
+            .group_by(data.c.game_id),
+        )
+        await db.execute(
+            query.on_conflict_do_update(
+                index_elements=[GameStats.game_id],
+                set_={
+                    **{
+                        field: getattr(GameStats, field)
+                        + getattr(query.excluded, field)
+                        for field in fields
+                    },
+                    "update_date": func.now(),
+                },
+            )
+        )
+
+    async def reconcile(self, db: AsyncSession) -> None:
+        await self.flush(db=db)
+        await db.execute(select(func.pg_advisory_xact_lock(lock)))
+        if await db.scalar(
+            select(
+                func.max(GameStats.reconciled_at)
+                > func.now()
+                - timedelta(seconds=settings.GAMES_STATS_RECONCILE_INTERVAL)
+            )
+        ):
+            await db.rollback()
+            return
+        profiles = (
+            select(Profile.game_id, func.count().label("profiles"))
+            .group_by(Profile.game_id)
+            .subquery()
+        )
+        rooms = (
+            select(Room.game_id, func.count().label("rooms"))
+            .group_by(Room.game_id)
+            .subquery()
+        )
+        players = (
+            select(Room.game_id, func.count().label("players"))
+            .join(User, User.room_id == Room.id)
+            .group_by(Room.game_id)
+            .subquery()
+        )
+        query = insert(GameStats).from_select(
+            ["game_id", *fields, "reconciled_at", "reconciled_snapshot"],
+            select(
+                Game.id,
+                func.coalesce(profiles.c.profiles, 0),
+                func.coalesce(rooms.c.rooms, 0),
+                func.coalesce(players.c.players, 0),
+                func.now(),
+                cast(func.pg_current_snapshot(), String),
+            )
+            .outerjoin(profiles, profiles.c.game_id == Game.id)
+            .outerjoin(rooms, rooms.c.game_id == Game.id)
+            .outerjoin(players, players.c.game_id == Game.id),
+        )
+        await db.execute(
+            query.on_conflict_do_update(
+                index_elements=[GameStats.game_id],
+                set_={
+                    **{field: getattr(query.excluded, field) for field in fields},
+                    "reconciled_at": query.excluded.reconciled_at,
+                    "reconciled_snapshot": query.excluded.reconciled_snapshot,
+                    "update_date": func.now(),
+                },
+            )
+        )
+        await db.commit()
+
+
+counters = GameCounters()
+event.listen(Session, "before_commit", counters.stamp)
+event.listen(Session, "after_commit", counters.commit)
+event.listen(Session, "after_rollback", counters.rollback)
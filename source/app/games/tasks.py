@@ -0,0 +1,33 @@
+import asyncio
+import logging
+from time import monotonic
+
+from source.app.games.stats import counters
+from source.core.database import SessionLocal
+from source.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def maintain_stats_periodically() -> None:
+    reconciled_at = None
+    try:
+        while True:
+            try:
+                async with SessionLocal() as db:
+                    if (
+                        reconciled_at is None
+                        or monotonic() - reconciled_at
+                        > settings.GAMES_STATS_RECONCILE_INTERVAL
+                    ):
+                        await counters.reconcile(db=db)
+                        reconciled_at = monotonic()
+                    else:
+                        await counters.flush(db=db)
+            except Exception:
+                logger.exception("Game stats flush failed")
+            await asyncio.sleep(settings.GAMES_STATS_FLUSH_INTERVAL)
+    except asyncio.CancelledError:
+        async with SessionLocal() as db:
+            await counters.flush(db=db)
+        raise
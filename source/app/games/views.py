@@ -1,7 +1,8 @@
-from fastapi import Depends, status
+from fastapi import Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from source.app.auth.auth import Admin, CurrentUser
+from source.app.games.cache import catalog
 from source.app.games.models import Game
 from source.app.games.schemas import (
     GameId,
@@ -9,19 +10,20 @@ from source.app.games.schemas import (
     GamePagination,
     GameRequest,
     GameResponse,
+    GameStatsResponse,
     GameUpdateRequest,
 )
 from source.app.games.services import (
     create_game,
     delete_game,
-    get_game,
-    list_games,
+    get_game_stats,
     update_game,
 )
 from source.core.database import get_db
 from source.core.exceptions import conflict, not_found
 from source.core.middlewares import CustomAPIRouter
 from source.core.schemas import ExceptionSchema
+from source.core.utils import check_etag
 
 games_router = CustomAPIRouter(prefix="/games")
 
@@ -49,16 +51,40 @@ async def game_create_admin(
     "/{game_id}",
     response_model=GameResponse,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {},
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
     },
     tags=["games"],
 )
 async def game_get(
+    user: CurrentUser,
+    http_request: Request,
+    request: GameId = Depends(),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    if record := await catalog.get(game_id=request.game_id, db=db):
+        content, etag = record
+        response = Response(content=content, media_type="application/json")
+        check_etag(request=http_request, response=response, etag=etag)
+        return response
+    return not_found(f"Game '{request.game_id}' not found")
+
+
+@games_router.get(
+    "/{game_id}/stats",
+    response_model=GameStatsResponse,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+    },
+    tags=["games"],
+)
+async def game_stats(
     user: CurrentUser, request: GameId = Depends(), db: AsyncSession = Depends(get_db)
-) -> Game:
-    if game := await get_game(game_id=request.game_id, db=db):
-        return game
+) -> GameStatsResponse:
+    if stats := await get_game_stats(game_id=request.game_id, db=db):
+        return stats
     return not_found(f"Game '{request.game_id}' not found")
 
 
@@ -106,18 +132,25 @@ async def game_delete_admin(
 @games_router.get(
     "/",
     response_model=GamePage,
-    responses={status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+    },
     tags=["games"],
 )
 async def games_list(
     user: CurrentUser,
+    http_request: Request,
     pagination: GamePagination = Depends(),
     db: AsyncSession = Depends(get_db),
-) -> GamePage:
-    return await list_games(
+) -> Response:
+    content = await catalog.page(
         page=pagination.page,
         size=pagination.size,
         sort=pagination.sort,
         order=pagination.order,
         db=db,
     )
+    response = Response(content=content, media_type="application/json")
+    check_etag(request=http_request, response=response, etag=catalog.etag)
+    return response
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from source.app.profiles.schemas import ProfileResponse
+from source.app.rooms.schemas import RoomDetailResponse
+from source.app.users.schemas import UserResponse
+
+
+class DashboardResponse(BaseModel):
+    user: UserResponse
+    profiles: list[ProfileResponse]
+    room: RoomDetailResponse | None = None
@@ -0,0 +1,31 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from source.app.me.schemas import DashboardResponse
+from source.app.profiles.models import Profile
+from source.app.rooms.models import Room
+from source.app.users.models import User
+
+
+async def get_dashboard(user: User, db: AsyncSession) -> DashboardResponse:
+    profiles = (
+        await db.scalars(
+            select(Profile)
+            .where(Profile.user_id == user.id)
+            .order_by(Profile.id)
+            .options(joinedload(Profile.game))
+        )
+    ).all()
+    room = None
+    if user.room_id:
+        room = await db.scalar(select(Room).where(Room.id == user.room_id))
+    if room:
+        members = await db.execute(
+            select(User.id, User.username, Profile.user_nickname, Profile.user_rank)
+            .join(Profile, Profile.user_id == User.id)
+            .where(User.room_id == room.id)
+            .where(Profile.game_id == room.game_id)
+        )
+        room.user_profiles = [member._asdict() for member in members]
+    return DashboardResponse(user=user, profiles=profiles, room=room)
@@ -0,0 +1,23 @@
+from fastapi import Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.app.auth.auth import CurrentUser
+from source.app.me.schemas import DashboardResponse
+from source.app.me.services import get_dashboard
+from source.core.database import get_db
+from source.core.middlewares import CustomAPIRouter
+from source.core.schemas import ExceptionSchema
+
+me_router = CustomAPIRouter(prefix="/me")
+
+
+@me_router.get(
+    "/dashboard",
+    response_model=DashboardResponse,
+    responses={status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema}},
+    tags=["me"],
+)
+async def dashboard_get(
+    user: CurrentUser, db: AsyncSession = Depends(get_db)
+) -> DashboardResponse:
+    return await get_dashboard(user=user, db=db)
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.app.profiles.models import Profile
+from source.core.metrics import Counter
+from source.core.notifications import listen, notify
+from source.core.settings import settings
+
+Key = tuple[int, int]
+Entry = tuple[str, str | None] | None
+
+
+class NicknameCache:
+    def __init__(self):
+        self.version = 0
+        self.entries: OrderedDict[Key, Entry] = OrderedDict()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def invalidate(self, payload: str | None = None) -> None:
+        self.version += 1
+        if payload is None:
+            self.entries.clear()
+            return
+        user_id, _, game_id = payload.partition(":")
+        if game_id:
+            self.entries.pop((int(user_id), int(game_id)), None)
+            return
+        for key in [key for key in self.entries if key[0] == int(user_id)]:
+            del self.entries[key]
+
+    async def notify(
+        self, user_id: int, db: AsyncSession, game_id: int | None = None
+    ) -> None:
+        payload = str(user_id) if game_id is None else f"{user_id}:{game_id}"
+        await notify(channel="profiles", payload=payload, db=db)
+
+    def put(self, key: Key, entry: Entry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > settings.PROFILE_CACHE_SIZE:
+            self.entries.popitem(last=False)
+
+    async def get_many(self, keys: list[Key], db: AsyncSession) -> dict[Key, Entry]:
+        found: dict[Key, Entry] = {}
+        missing = []
+        for key in keys:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                found[key] = self.entries[key]
+            else:
+                missing.append(key)
+        self.hits.inc(len(found))
+        self.misses.inc(len(missing))
+        if missing:
+            version = self.version
+            profiles = await db.execute(
+                select(
+                    Profile.user_id,
+                    Profile.game_id,
+                    Profile.user_nickname,
+                    Profile.user_rank,
+                ).where(tuple_(Profile.user_id, Profile.game_id).in_(missing))
+            )
+            loaded = {
+                (user_id, game_id): (nickname, rank)
+                for user_id, game_id, nickname, rank in profiles
+            }
+            for key in missing:
+                found[key] = loaded.get(key)
+                if version == self.version and not db.info.get("replica"):
+                    self.put(key=key, entry=found[key])
+        return found
+
+    async def get(self, user_id: int, game_id: int, db: AsyncSession) -> Entry:
+        key = (user_id, game_id)
+        return (await self.get_many(keys=[key], db=db))[key]
+
+
+nicknames = NicknameCache()
+listen("profiles", nicknames.invalidate)
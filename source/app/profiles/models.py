@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from source.core.models import Model
@@ -15,13 +15,22 @@ else:
 
 class Profile(Model):
     __tablename__ = "Profiles"
-    __table_args__ = (UniqueConstraint("user_id", "game_id", name="user_game"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "game_id", name="user_game"),
+        Index("ix_Profiles_game_id_user_rank_id", "game_id", "user_rank", "id"),
+        Index(
+            "ix_Profiles_game_id_user_nickname",
+            "game_id",
+            "user_nickname",
+            postgresql_ops={"user_nickname": "text_pattern_ops"},
+        ),
+    )
 
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("Users.id"), index=True, primary_key=True
+        ForeignKey("Users.id", ondelete="CASCADE"), index=True, primary_key=True
     )
     game_id: Mapped[int] = mapped_column(
-        ForeignKey("Games.id"), index=True, primary_key=True
+        ForeignKey("Games.id", ondelete="CASCADE"), index=True, primary_key=True
     )
 
     user_nickname: Mapped[str | None]
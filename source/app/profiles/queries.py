@@ -0,0 +1,12 @@
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from source.app.profiles.models import Profile
+
+
+def profile_by_user_game(user_id: int, game_id: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Profile)
+        .where(Profile.user_id == user_id)
+        .where(Profile.game_id == game_id)
+    )
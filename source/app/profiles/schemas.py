@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from source.app.games.schemas import GameResponse
-from source.app.rooms.enums import Order, Sort
-from source.core.schemas import PageSchema, PaginationSchema, ResponseSchema
+from source.app.profiles.enums import Order, Sort
+from source.core.schemas import (
+    CursorPaginationSchema,
+    PageSchema,
+    PaginationSchema,
+    ResponseSchema,
+)
 
 
 class ProfileRequest(BaseModel):
@@ -36,3 +41,43 @@ class ProfilePagination(PaginationSchema):
 
 class ProfileId(BaseModel):
     profile_id: int
+
+
+class ProfileSearch(CursorPaginationSchema):
+    game_id: int
+    nickname: str | None = None
+
+
+class ProfileSearchResult(BaseModel):
+    id: int
+    user_id: int
+    game_id: int
+    user_nickname: str | None
+    user_rank: str | None
+
+
+class ProfileSearchPage(BaseModel):
+    profiles: list[ProfileSearchResult]
+    size: int
+    next_cursor: str | None = None
+
+
+class ProfileBatchItem(BaseModel):
+    game_id: int
+    user_nickname: str | None = None
+    user_rank: str | None = None
+
+
+class ProfileBatchRequest(BaseModel):
+    profiles: list[ProfileBatchItem] = Field(min_length=1, max_length=50)
+
+
+class ProfileBatchResult(BaseModel):
+    game_id: int
+    created: bool | None = None
+    profile: Profile | None = None
+    error: str | None = None
+
+
+class ProfileBatchResponse(BaseModel):
+    profiles: list[ProfileBatchResult]
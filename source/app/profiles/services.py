@@ -1,23 +1,32 @@
 from math import ceil
 
-from sqlalchemy import asc, desc, select
+from sqlalchemy import Boolean, asc, desc, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from source.app.games.models import Game
+from source.app.games.stats import counters
+from source.app.profiles.cache import nicknames
+from source.app.profiles.enums import Order, Sort
 from source.app.profiles.models import Profile
+from source.app.profiles.schemas import Profile as ProfileSchema
 from source.app.profiles.schemas import (
+    ProfileBatchItem,
+    ProfileBatchResult,
     ProfilePage,
     ProfileRequest,
-    ProfileResponse,
+    ProfileSearchPage,
+    ProfileSearchResult,
     ProfileUpdateRequest,
 )
-from source.app.rooms.enums import Order, Sort
 from source.app.rooms.models import Room
+from source.app.rooms.relay import bump_room
 from source.app.rooms.services import delete_room
 from source.app.users.models import User
-from source.core.exceptions import conflict
+from source.core.exceptions import bad_request, conflict
+from source.core.utils import decode_cursor, encode_cursor, escape_like
 
 
 async def get_profile(
@@ -45,16 +54,85 @@ async def create_profile(
         )
         try:
             db.add(profile)
+            await nicknames.notify(user_id=user.id, game_id=game.id, db=db)
+            counters.add(db=db, game_id=game.id, profiles=1)
             await db.commit()
-            await db.refresh(
-                profile, attribute_names=ProfileResponse.model_fields.keys()
-            )
+            nicknames.invalidate(payload=f"{user.id}:{game.id}")
             return profile
         except IntegrityError:
             return conflict("You already have a profile in this game")
     return None
 
 
+async def upsert_profiles(
+    items: list[ProfileBatchItem], user: User, db: AsyncSession
+) -> list[ProfileBatchResult]:
+    existing = dict(
+        (
+            await db.execute(
+                select(Game.id, Profile.id)
+                .outerjoin(
+                    Profile,
+                    (Profile.game_id == Game.id) & (Profile.user_id == user.id),
+                )
+                .where(Game.id.in_({item.game_id for item in items}))
+            )
+        ).all()
+    )
+    results = [ProfileBatchResult(game_id=item.game_id) for item in items]
+    rows, indexes = [], {}
+    for index, item in enumerate(items):
+        if item.game_id not in existing:
+            results[index].error = f"Game '{item.game_id}' not found"
+        elif item.game_id in indexes:
+            results[index].error = f"Game '{item.game_id}' is repeated in the batch"
+        elif existing[item.game_id] is None and item.user_nickname is None:
+            results[index].error = "user_nickname is required for a new profile"
+        else:
+            indexes[item.game_id] = index
+            rows.append({"user_id": user.id, **item.model_dump()})
+    if not rows:
+        return results
+
+    query = insert(Profile).values(rows)
+    query = query.on_conflict_do_update(
+        constraint="user_game",
+        set_={
+            "user_nickname": func.coalesce(
+                query.excluded.user_nickname, Profile.user_nickname
+            ),
+            "user_rank": func.coalesce(query.excluded.user_rank, Profile.user_rank),
+            "update_date": func.now(),
+        },
+    ).returning(
+        Profile.id,
+        Profile.game_id,
+        Profile.create_date,
+        Profile.update_date,
+        Profile.user_nickname,
+        Profile.user_rank,
+        literal_column("xmax = 0", Boolean).label("created"),
+    )
+    try:
+        profiles = (await db.execute(query)).all()
+        await nicknames.notify(user_id=user.id, db=db)
+        for profile in profiles:
+            if profile.created:
+                counters.add(db=db, game_id=profile.game_id, profiles=1)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return conflict("Profiles changed during the batch, try again")
+    nicknames.invalidate(payload=str(user.id))
+    if user.room_id:
+        await bump_room(room_id=user.room_id)
+    for profile in profiles:
+        result = results[indexes[profile.game_id]]
+        result.created = profile.created
+        result.profile = ProfileSchema.model_validate(profile)
+    return results
+
+
 async def update_profile(
     profile_id: int,
     payload: ProfileUpdateRequest,
@@ -66,8 +144,11 @@ async def update_profile(
         for key, value in fields_to_update:
             if value is not None:
                 setattr(profile, key, value)
+        await nicknames.notify(user_id=user.id, game_id=profile.game_id, db=db)
         await db.commit()
-        await db.refresh(profile)
+        nicknames.invalidate(payload=f"{user.id}:{profile.game_id}")
+        if user.room_id:
+            await bump_room(room_id=user.room_id)
         return profile
     return None
 
@@ -81,7 +162,10 @@ async def delete_profile(profile_id: int, user: User, db: AsyncSession) -> bool:
             if room and room.game_id == profile.game_id:
                 await delete_room(user=user, db=db)
         await db.delete(profile)
+        await nicknames.notify(user_id=user.id, game_id=profile.game_id, db=db)
+        counters.add(db=db, game_id=profile.game_id, profiles=-1)
         await db.commit()
+        nicknames.invalidate(payload=f"{user.id}:{profile.game_id}")
         return True
     return False
 
@@ -110,3 +194,44 @@ async def list_profiles(
         total=total,
         pages=(ceil(total / size)),
     )
+
+
+async def search_profiles(
+    game_id: int,
+    user_ranks: list[str] | None,
+    nickname: str | None,
+    size: int,
+    cursor: str | None,
+    db: AsyncSession,
+) -> ProfileSearchPage:
+    query = (
+        select(
+            Profile.id,
+            Profile.user_id,
+            Profile.game_id,
+            Profile.user_nickname,
+            Profile.user_rank,
+        )
+        .where(Profile.game_id == game_id)
+        .order_by(Profile.id)
+        .limit(size + 1)
+    )
+    if user_ranks:
+        query = query.where(Profile.user_rank.in_(user_ranks))
+    if nickname:
+        query = query.where(
+            Profile.user_nickname.like(f"{escape_like(nickname)}%", escape="\\")
+        )
+    if cursor:
+        (last_id,) = decode_cursor(cursor=cursor, length=1)
+        if not isinstance(last_id, int):
+            return bad_request("Invalid cursor")
+        query = query.where(Profile.id > last_id)
+
+    profiles = [ProfileSearchResult(**row._asdict()) for row in await db.execute(query)]
+    next_cursor = None
+    if len(profiles) > size:
+        profiles = profiles[:size]
+        next_cursor = encode_cursor(profiles[-1].id)
+
+    return ProfileSearchPage(profiles=profiles, size=size, next_cursor=next_cursor)
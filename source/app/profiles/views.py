@@ -1,15 +1,21 @@
-from fastapi import Depends
+from typing import Annotated
+
+from fastapi import Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from source.app.auth.auth import CurrentUser
 from source.app.profiles.models import Profile
 from source.app.profiles.schemas import (
+    ProfileBatchRequest,
+    ProfileBatchResponse,
     ProfileId,
     ProfilePage,
     ProfilePagination,
     ProfileRequest,
     ProfileResponse,
+    ProfileSearch,
+    ProfileSearchPage,
     ProfileUpdateRequest,
 )
 from source.app.profiles.services import (
@@ -17,12 +23,15 @@ from source.app.profiles.services import (
     delete_profile,
     get_profile,
     list_profiles,
+    search_profiles,
     update_profile,
+    upsert_profiles,
 )
-from source.core.database import get_db
+from source.core.database import get_db, get_read_db
 from source.core.exceptions import not_found
 from source.core.middlewares import CustomAPIRouter
 from source.core.schemas import ExceptionSchema
+from source.core.utils import json_response
 
 profiles_router = CustomAPIRouter(prefix="/profiles")
 
@@ -45,6 +54,46 @@ async def profile_create(
     return not_found(f"'Game {request.game_id}' not found")
 
 
+@profiles_router.post(
+    "/batch",
+    response_model=ProfileBatchResponse,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_409_CONFLICT: {"model": ExceptionSchema},
+    },
+    tags=["profiles"],
+)
+async def profile_batch(
+    user: CurrentUser, request: ProfileBatchRequest, db: AsyncSession = Depends(get_db)
+) -> ProfileBatchResponse:
+    return ProfileBatchResponse(
+        profiles=await upsert_profiles(items=request.profiles, user=user, db=db)
+    )
+
+
+@profiles_router.get(
+    "/search",
+    response_model=ProfileSearchPage,
+    responses={status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema}},
+    tags=["profiles"],
+)
+async def profile_search(
+    user: CurrentUser,
+    user_rank: Annotated[list[str] | None, Query()] = None,
+    search: ProfileSearch = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    profiles = await search_profiles(
+        game_id=search.game_id,
+        user_ranks=user_rank,
+        nickname=search.nickname,
+        size=search.size,
+        cursor=search.cursor,
+        db=db,
+    )
+    return json_response(content=profiles)
+
+
 @profiles_router.get(
     "/{profile_id}",
     response_model=ProfileResponse,
@@ -113,9 +162,9 @@ async def profile_delete(
 async def profile_list(
     user: CurrentUser,
     pagination: ProfilePagination = Depends(),
-    db: AsyncSession = Depends(get_db),
-) -> ProfilePage:
-    return await list_profiles(
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    profiles = await list_profiles(
         user_id=user.id,
         page=pagination.page,
         size=pagination.size,
@@ -123,3 +172,4 @@ async def profile_list(
         order=pagination.order,
         db=db,
     )
+    return json_response(content=profiles)
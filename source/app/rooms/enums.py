@@ -11,3 +11,11 @@ class Sort(str, Enum):
 class Order(str, Enum):
     ASC = "asc"
     DESC = "desc"
+
+
+class RoomEvent(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    OCCUPANCY = "occupancy"
+    RESET = "reset"
@@ -0,0 +1,78 @@
+import asyncio
+
+from source.app.rooms.enums import RoomEvent
+from source.core.settings import settings
+
+
+class LobbyFeed:
+    def __init__(self):
+        self.subscribers: dict[int | None, set[asyncio.Queue]] = {}
+        self.pending: dict[int, dict[int, dict]] = {}
+        self.task: asyncio.Task | None = None
+
+    def subscribe(self, game_id: int | None) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.LOBBY_FEED_QUEUE_SIZE)
+        self.subscribers.setdefault(game_id, set()).add(queue)
+        if not self.task or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return queue
+
+    def unsubscribe(self, game_id: int | None, queue: asyncio.Queue) -> None:
+        queues = self.subscribers.get(game_id, set())
+        queues.discard(queue)
+        if not queues:
+            self.subscribers.pop(game_id, None)
+
+    def subscribed(self, game_id: int | None = None) -> bool:
+        if game_id is None:
+            return bool(self.subscribers)
+        return game_id in self.subscribers or None in self.subscribers
+
+    def publish(self, event: RoomEvent, room: dict) -> None:
+        if not self.subscribed(room["game_id"]):
+            return
+        events = self.pending.setdefault(room["game_id"], {})
+        if previous := events.get(room["id"]):
+            if previous["event"] == RoomEvent.DELETED:
+                return
+            if previous["event"] == RoomEvent.CREATED:
+                if event == RoomEvent.DELETED:
+                    del events[room["id"]]
+                    return
+                event = RoomEvent.CREATED
+            elif event == RoomEvent.OCCUPANCY:
+                event = previous["event"]
+        events[room["id"]] = {"event": event, "room": room}
+
+    def reset(self) -> None:
+        self.pending.clear()
+        for queues in self.subscribers.values():
+            for queue in queues:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait([{"event": RoomEvent.RESET, "room": None}])
+
+    async def run(self) -> None:
+        while self.subscribers:
+            await asyncio.sleep(settings.LOBBY_FEED_INTERVAL)
+            self.flush()
+        self.pending.clear()
+
+    def flush(self) -> None:
+        pending, self.pending = self.pending, {}
+        batches: dict[asyncio.Queue, list] = {}
+        for game_id, events in pending.items():
+            queues = self.subscribers.get(game_id, set()) | self.subscribers.get(
+                None, set()
+            )
+            for queue in queues:
+                batches.setdefault(queue, []).extend(events.values())
+        for queue, batch in batches.items():
+            if queue.full():
+                while not queue.empty():
+                    queue.get_nowait()
+                batch = [{"event": RoomEvent.RESET, "room": None}]
+            queue.put_nowait(batch)
+
+
+feed = LobbyFeed()
@@ -0,0 +1,93 @@
+import heapq
+from itertools import count
+
+from source.app.rooms.enums import RoomEvent
+
+
+class Matchmaker:
+    def __init__(self):
+        self.games: set[int] = set()
+        self.rooms: dict[int, tuple[int, tuple[str | None, ...], int]] = {}
+        self.queues: dict[tuple[int, str | None], list] = {}
+        self.live: dict[tuple[int, str | None], int] = {}
+        self.versions = count()
+
+    def loaded(self, game_id: int | None = None) -> bool:
+        if game_id is None:
+            return bool(self.games)
+        return game_id in self.games
+
+    def load(self, game_id: int, rooms: list[dict]) -> None:
+        self.games.add(game_id)
+        for room in rooms:
+            self.update(room=room)
+
+    def reset(self) -> None:
+        self.games.clear()
+        self.rooms.clear()
+        self.queues.clear()
+        self.live.clear()
+
+    def publish(self, event: RoomEvent, room: dict) -> None:
+        if room["game_id"] not in self.games:
+            return
+        if event == RoomEvent.DELETED:
+            self.discard(room_id=room["id"])
+        else:
+            self.update(room=room)
+
+    def update(self, room: dict) -> None:
+        self.discard(room_id=room["id"])
+        if room["number_of_users"] >= room["room_size"]:
+            return
+        version = next(self.versions)
+        ranks = tuple(room["room_ranks"] or [None])
+        self.rooms[room["id"]] = (room["game_id"], ranks, version)
+        priority = -room["number_of_users"] / room["room_size"]
+        for rank in ranks:
+            key = (room["game_id"], rank)
+            queue = self.queues.setdefault(key, [])
+            heapq.heappush(queue, (priority, room["id"], version))
+            self.live[key] = self.live.get(key, 0) + 1
+            if len(queue) > 2 * self.live[key] + 16:
+                self.compact(key=key)
+
+    def discard(self, room_id: int) -> None:
+        if state := self.rooms.pop(room_id, None):
+            game_id, ranks, _ = state
+            for rank in ranks:
+                self.live[(game_id, rank)] -= 1
+
+    def compact(self, key: tuple[int, str | None]) -> None:
+        self.queues[key] = [entry for entry in self.queues[key] if self.valid(entry)]
+        heapq.heapify(self.queues[key])
+
+    def valid(self, entry: tuple) -> bool:
+        state = self.rooms.get(entry[1])
+        return state is not None and state[2] == entry[2]
+
+    def peek(self, key: tuple[int, str | None], exclude: set) -> tuple | None:
+        queue = self.queues.get(key, [])
+        skipped = []
+        while queue and (not self.valid(queue[0]) or queue[0][1] in exclude):
+            entry = heapq.heappop(queue)
+            if self.valid(entry):
+                skipped.append(entry)
+        best = queue[0] if queue else None
+        for entry in skipped:
+            heapq.heappush(queue, entry)
+        return best
+
+    def best(self, game_id: int, rank: str | None, exclude: set) -> int | None:
+        candidates = []
+        if rank is not None and (entry := self.peek((game_id, rank), exclude)):
+            candidates.append((0, entry))
+        if entry := self.peek((game_id, None), exclude):
+            candidates.append((1, entry))
+        if not candidates:
+            return None
+        _, (_, room_id, _) = min(candidates)
+        return room_id
+
+
+matchmaker = Matchmaker()
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ARRAY, ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from source.core.models import Model
@@ -15,10 +16,21 @@ else:
 
 class Room(Model):
     __tablename__ = "Rooms"
+    __table_args__ = (
+        Index("ix_Rooms_room_ranks", "room_ranks", postgresql_using="gin"),
+        Index(
+            "ix_Rooms_room_name_trgm",
+            "room_name",
+            postgresql_using="gin",
+            postgresql_ops={"room_name": "gin_trgm_ops"},
+        ),
+    )
 
-    game_id: Mapped[int] = mapped_column(ForeignKey("Games.id"), index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("Games.id", ondelete="CASCADE"), index=True
+    )
     owner_id: Mapped[int | None] = mapped_column(
-        ForeignKey(column="Users.id", use_alter=True), index=True
+        ForeignKey(column="Users.id", use_alter=True, ondelete="CASCADE"), index=True
     )
 
     room_name: Mapped[str] = mapped_column(index=True)
@@ -32,4 +44,6 @@ class Room(Model):
         primaryjoin="User.id == Room.owner_id",
         post_update=True,
     )
-    users: Mapped[list[User]] = relationship(primaryjoin="User.room_id == Room.id")
+    users: Mapped[list[User]] = relationship(
+        primaryjoin="User.room_id == Room.id", passive_deletes=True
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from source.app.rooms.models import Room
+
+
+def room_by_id(room_id: int) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(Room).where(Room.id == room_id))
+
+
+def room_with_users(room_id: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Room).where(Room.id == room_id).options(selectinload(Room.users))
+    )
+
+
+def room_game_id(room_id: int) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(Room.game_id).where(Room.id == room_id))
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from source.app.rooms.enums import RoomEvent
+from source.app.rooms.feed import feed
+from source.app.rooms.matchmaking import matchmaker
+from source.app.rooms.models import Room
+from source.app.rooms.schemas import RoomResponse
+from source.app.rooms.versions import versions
+from source.core import notifications
+from source.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class RoomRelay:
+    def __init__(self):
+        self.pending: dict[int, tuple[RoomEvent, int | None]] = {}
+        self.task: asyncio.Task | None = None
+
+    async def publish(
+        self, room_id: int, game_id: int | None, event: RoomEvent | None = None
+    ) -> None:
+        await notifications.publish(
+            channel="rooms",
+            payload=json.dumps(
+                {
+                    "origin": notifications.origin,
+                    "room_id": room_id,
+                    "game_id": game_id,
+                    "event": event.value if event else None,
+                }
+            ),
+        )
+
+    def reset(self) -> None:
+        self.pending.clear()
+        versions.reset()
+        matchmaker.reset()
+        feed.reset()
+
+    def receive(self, payload: str | None) -> None:
+        if payload is None:
+            return self.reset()
+        message = json.loads(payload)
+        if message["origin"] == notifications.origin:
+            return None
+        room_id, game_id = message["room_id"], message["game_id"]
+        versions.bump(room_id=room_id, game_id=game_id)
+        if message["event"] is None or (
+            not feed.subscribed(game_id) and not matchmaker.loaded(game_id)
+        ):
+            return None
+        event = RoomEvent(message["event"])
+        if previous := self.pending.pop(room_id, None):
+            if previous[0] == RoomEvent.CREATED and event != RoomEvent.DELETED:
+                event = RoomEvent.CREATED
+            game_id = game_id if game_id is not None else previous[1]
+        self.pending[room_id] = (event, game_id)
+        if not self.task or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return None
+
+    async def run(self) -> None:
+        while self.pending:
+            pending, self.pending = self.pending, {}
+            try:
+                await self.apply(pending=pending)
+            except Exception:
+                logger.exception("Room relay failed")
+                matchmaker.reset()
+                feed.reset()
+
+    async def apply(self, pending: dict[int, tuple[RoomEvent, int | None]]) -> None:
+        room_ids = [
+            room_id
+            for room_id, (event, _) in pending.items()
+            if event != RoomEvent.DELETED
+        ]
+        rooms = {}
+        if room_ids:
+            async with SessionLocal() as db:
+                rooms = {
+                    room.id: RoomResponse.model_validate(room).model_dump(
+                        mode="json", by_alias=True
+                    )
+                    for room in await db.scalars(
+                        select(Room)
+                        .where(Room.id.in_(room_ids))
+                        .options(selectinload(Room.users))
+                    )
+                }
+        for room_id, (event, game_id) in pending.items():
+            if event == RoomEvent.DELETED:
+                room = {"id": room_id, "game_id": game_id}
+            elif not (room := rooms.get(room_id)):
+                continue
+            feed.publish(event=event, room=room)
+            matchmaker.publish(event=event, room=room)
+
+
+relay = RoomRelay()
+notifications.listen("rooms", relay.receive)
+
+
+async def bump_room(room_id: int) -> None:
+    versions.bump(room_id=room_id)
+    await relay.publish(room_id=room_id, game_id=None)
@@ -61,6 +61,12 @@ class RoomPagination(PaginationSchema):
     sort: Sort = Sort.ID
     order: Order = Order.ASC
     game_id: int | None = None
+    rank: str | None = None
+    search: str | None = Field(default=None, min_length=3)
+
+
+class QuickJoinRequest(BaseModel):
+    game_id: int
 
 
 class RoomId(BaseModel):
@@ -1,21 +1,32 @@
 from math import ceil
 
+from fastapi import HTTPException
 from sqlalchemy import asc, desc, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from source.app.profiles.models import Profile
-from source.app.rooms.enums import Order, Sort
+from source.app.games.stats import counters
+from source.app.profiles.cache import nicknames
+from source.app.profiles.queries import profile_by_user_game
+from source.app.rooms.enums import Order, RoomEvent, Sort
+from source.app.rooms.feed import feed
+from source.app.rooms.matchmaking import matchmaker
 from source.app.rooms.models import Room
+from source.app.rooms.queries import room_by_id, room_with_users
+from source.app.rooms.relay import relay
 from source.app.rooms.schemas import (
+    QuickJoinRequest,
     RoomPage,
     RoomRequest,
     RoomResponse,
     RoomUpdateRequest,
 )
+from source.app.rooms.versions import versions
 from source.app.users.models import User
-from source.core.exceptions import bad_request, forbidden, not_found
+from source.core.exceptions import bad_request, conflict, forbidden, not_found
+from source.core.settings import settings
+from source.core.utils import escape_like
 
 
 async def get_room(
@@ -25,51 +36,89 @@ async def get_room(
 ) -> Room | None:
     if not room_id:
         return None
-    query = select(Room).where(Room.id == room_id)
     if not relation:
-        return await db.scalar(query)
-    query = query.options(selectinload(Room.users))
-    if room := await db.scalar(query.options(selectinload(Room.users))):
-        user_ids = [user.id for user in room.users]
-        users = await db.scalars(
-            select(Profile)
-            .where(Profile.user_id.in_(user_ids))
-            .where(Profile.game_id == room.game_id)
-            .options(selectinload(Profile.user))
+        return await db.scalar(room_by_id(room_id=room_id))
+    if room := await db.scalar(
+        room_with_users(room_id=room_id),
+        execution_options={"populate_existing": True},
+    ):
+        profiles = await nicknames.get_many(
+            keys=[(user.id, room.game_id) for user in room.users], db=db
         )
         user_profiles: list = []
-        for user in users:
-            user_profiles.append(
-                {
-                    "id": user.user_id,
-                    "username": user.user.username,
-                    "user_nickname": user.user_nickname,
-                    "user_rank": user.user_rank,
-                }
-            )
+        for user in room.users:
+            if entry := profiles[(user.id, room.game_id)]:
+                user_nickname, user_rank = entry
+                user_profiles.append(
+                    {
+                        "id": user.id,
+                        "username": user.username,
+                        "user_nickname": user_nickname,
+                        "user_rank": user_rank,
+                    }
+                )
         room.user_profiles = user_profiles
     return room
 
 
+async def count_members(room_id: int, db: AsyncSession) -> int:
+    return await db.scalar(select(func.count(User.id)).where(User.room_id == room_id))
+
+
+async def publish_room(
+    event: RoomEvent,
+    room_id: int,
+    db: AsyncSession,
+    game_id: int | None = None,
+) -> None:
+    versions.bump(room_id=room_id, game_id=game_id)
+    await relay.publish(room_id=room_id, game_id=game_id, event=event)
+    if not feed.subscribed(game_id) and not matchmaker.loaded(game_id):
+        return
+    if event == RoomEvent.DELETED:
+        data = {"id": room_id, "game_id": game_id}
+    elif room := await db.scalar(
+        room_with_users(room_id=room_id),
+        execution_options={"populate_existing": True},
+    ):
+        data = RoomResponse.model_validate(room).model_dump(mode="json", by_alias=True)
+    else:
+        return
+    feed.publish(event=event, room=data)
+    matchmaker.publish(event=event, room=data)
+
+
 async def create_room(
     request: RoomRequest, user: User, db: AsyncSession
 ) -> Room | None:
-    if await db.scalar(
-        select(Profile)
-        .where(Profile.user_id == user.id)
-        .where(Profile.game_id == request.game_id)
-    ):
+    if await db.scalar(profile_by_user_game(user_id=user.id, game_id=request.game_id)):
         room = Room(**request.model_dump())
         room.owner_id = user.id
+        events: list[tuple[RoomEvent, int, int | None]] = []
+        deltas: list[tuple[int, int, int]] = []
         if old_room := await db.scalar(select(Room).where(Room.owner_id == user.id)):
+            events.append((RoomEvent.DELETED, old_room.id, old_room.game_id))
+            members = await count_members(room_id=old_room.id, db=db)
+            deltas.append((old_room.game_id, -1, -members))
             await db.delete(old_room)
+        elif user.room_id:
+            events.append((RoomEvent.OCCUPANCY, user.room_id, None))
+            game_id = await db.scalar(
+                select(Room.game_id).where(Room.id == user.room_id)
+            )
+            deltas.append((game_id, 0, -1))
         user.room = room
+        deltas.append((room.game_id, 1, 1))
+        for game_id, rooms, players in deltas:
+            counters.add(db=db, game_id=game_id, rooms=rooms, players=players)
         try:
             db.add(room)
             await db.commit()
-            await db.refresh(room, attribute_names=RoomResponse.model_fields.keys())
         except IntegrityError:
-            return None
+            return conflict("The room could not be created, please try again")
+        events.append((RoomEvent.CREATED, room.id, room.game_id))
+        for event, room_id, game_id in events:
+            await publish_room(event=event, room_id=room_id, game_id=game_id, db=db)
         return room
     return None
 
@@ -79,7 +128,7 @@ async def update_room(
     user: User,
     db: AsyncSession,
 ) -> Room | None:
-    if room := await get_room(room_id=user.room_id, db=db):
+    if room := await db.scalar(room_with_users(room_id=user.room_id)):
         if room.owner_id != user.id:
             return forbidden("You are not the owner of the room")
         fields_to_update = payload.model_dump().items()
@@ -87,17 +136,25 @@ async def update_room(
             if value is not None:
                 setattr(room, key, value)
         await db.commit()
-        await db.refresh(room, attribute_names=RoomResponse.model_fields.keys())
+        await publish_room(
+            event=RoomEvent.UPDATED, room_id=room.id, game_id=room.game_id, db=db
+        )
         return room
     return None
 
 
 async def delete_room(user: User, db: AsyncSession) -> bool:
     if room := await get_room(room_id=user.room_id, db=db):
+        room_id, game_id = room.id, room.game_id
+        event, rooms, players = RoomEvent.OCCUPANCY, 0, -1
         if room.owner_id == user.id:
+            players = -await count_members(room_id=room_id, db=db)
             await db.delete(room)
+            event, rooms = RoomEvent.DELETED, -1
         user.room_id = None
+        counters.add(db=db, game_id=game_id, rooms=rooms, players=players)
         await db.commit()
+        await publish_room(event=event, room_id=room_id, game_id=game_id, db=db)
         return True
     return False
 
@@ -109,11 +166,14 @@ async def list_rooms(
     order: Order,
     game_id: int | None,
     db: AsyncSession,
+    rank: str | None = None,
+    search: str | None = None,
 ) -> RoomPage:
     order = asc(sort) if order == Order.ASC else desc(sort)
 
     subquery = (
         select(User.room_id)
+        .where(User.room_id == Room.id)
         .group_by(User.room_id)
         .having(func.count(User.id) < Room.room_size)
         .lateral()
@@ -128,6 +188,12 @@ async def list_rooms(
     )
     if game_id:
         query = query.where(Room.game_id == game_id)
+    if rank:
+        query = query.where(Room.room_ranks.contains([rank]))
+    if search:
+        query = query.where(
+            Room.room_name.ilike(f"%{escape_like(search)}%", escape="\\")
+        )
 
     rooms = (await db.scalars(query)).all()
     total = len(rooms)
@@ -145,24 +211,35 @@ async def join_room(room_id: int, user: User, db: AsyncSession) -> Room | None:
     if room := await get_room(room_id=room_id, db=db):
         if user.room_id == room_id:
             return bad_request("You already in this room")
-        if room.room_size <= await db.scalar(
-            select(func.count(User.id)).where(User.room_id == room_id)
-        ):
+        if room.room_size <= await count_members(room_id=room_id, db=db):
             return bad_request("The room is full")
         if not await db.scalar(
-            select(Profile)
-            .where(Profile.user_id == user.id)
-            .where(Profile.game_id == room.game_id)
+            profile_by_user_game(user_id=user.id, game_id=room.game_id)
         ):
             return not_found(
                 f"You need to create a game profile for game {room.game_id}"
             )
+        events: list[tuple[RoomEvent, int, int | None]] = []
+        deltas: list[tuple[int, int, int]] = []
         if user.room_id:
             old_room = await db.get(Room, user.room_id)
+            event, rooms, players = RoomEvent.OCCUPANCY, 0, -1
             if old_room.owner_id == user.id:
+                players = -await count_members(room_id=old_room.id, db=db)
                 await db.delete(old_room)
+                event, rooms = RoomEvent.DELETED, -1
+            events.append((event, old_room.id, old_room.game_id))
+            deltas.append((old_room.game_id, rooms, players))
+        events.append((RoomEvent.OCCUPANCY, room.id, room.game_id))
+        deltas.append((room.game_id, 0, 1))
         user.room = room
+        for game_id, rooms, players in deltas:
+            counters.add(db=db, game_id=game_id, rooms=rooms, players=players)
         await db.commit()
+        for event, event_room_id, game_id in events:
+            await publish_room(
+                event=event, room_id=event_room_id, game_id=game_id, db=db
+            )
         return await get_room(room_id=room_id, db=db, relation=True)
     return None
 
@@ -180,7 +257,70 @@ async def kick_room(
     if room := await db.get(Room, user.room_id):
         if room.owner_id != user.id:
             return forbidden("You are not the owner of the room")
+        room_id, game_id = room.id, room.game_id
         kick_user.room_id = None
+        counters.add(db=db, game_id=game_id, players=-1)
         await db.commit()
+        await publish_room(
+            event=RoomEvent.OCCUPANCY, room_id=room_id, game_id=game_id, db=db
+        )
         return True
     return False
+
+
+async def load_matchmaking(game_id: int, db: AsyncSession) -> None:
+    rooms = await db.execute(
+        select(
+            Room.id,
+            Room.game_id,
+            Room.room_ranks,
+            Room.room_size,
+            func.count(User.id).label("number_of_users"),
+        )
+        .outerjoin(User, User.room_id == Room.id)
+        .where(Room.game_id == game_id)
+        .group_by(Room.id)
+        .having(func.count(User.id) < Room.room_size)
+    )
+    matchmaker.load(game_id=game_id, rooms=[room._asdict() for room in rooms])
+
+
+async def quick_join(
+    request: QuickJoinRequest, user: User, db: AsyncSession
+) -> Room | None:
+    profile = await db.scalar(
+        profile_by_user_game(user_id=user.id, game_id=request.game_id)
+    )
+    if not profile:
+        return None
+    if not matchmaker.loaded(request.game_id):
+        await load_matchmaking(game_id=request.game_id, db=db)
+    tried = {user.room_id}
+    for _ in range(settings.MATCHMAKING_ATTEMPTS):
+        room_id = matchmaker.best(
+            game_id=request.game_id, rank=profile.user_rank, exclude=tried
+        )
+        if room_id is None:
+            break
+        tried.add(room_id)
+        try:
+            if room := await join_room(room_id=room_id, user=user, db=db):
+                return room
+        except HTTPException:
+            await publish_room(event=RoomEvent.OCCUPANCY, room_id=room_id, db=db)
+            continue
+        await publish_room(
+            event=RoomEvent.DELETED, room_id=room_id, game_id=request.game_id, db=db
+        )
+    room = await create_room(
+        request=RoomRequest(
+            game_id=request.game_id,
+            room_name=f"{profile.user_nickname}'s room",
+            room_ranks=[profile.user_rank] if profile.user_rank else None,
+        ),
+        user=user,
+        db=db,
+    )
+    if room:
+        return await get_room(room_id=room.id, db=db, relation=True)
+    return None
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.app.games.stats import counters
+from source.app.rooms.enums import RoomEvent
+from source.app.rooms.models import Room
+from source.app.rooms.services import publish_room
+from source.app.users.models import User
+from source.core.database import SessionLocal
+from source.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def sweep_rooms(db: AsyncSession) -> int:
+    removed = 0
+    while True:
+        room_ids = (
+            await db.scalars(
+                select(Room.id)
+                .where(
+                    Room.update_date
+                    < func.now() - timedelta(seconds=settings.ROOM_SWEEP_GRACE)
+                )
+                .where(
+                    ~exists()
+                    .where(User.id == Room.owner_id)
+                    .where(User.room_id == Room.id)
+                )
+                .order_by(Room.id)
+                .limit(settings.ROOM_SWEEP_BATCH)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not room_ids:
+            break
+        members = dict(
+            (
+                await db.execute(
+                    select(User.room_id, func.count(User.id))
+                    .where(User.room_id.in_(room_ids))
+                    .group_by(User.room_id)
+                )
+            ).all()
+        )
+        rooms = (
+            await db.execute(
+                delete(Room)
+                .where(Room.id.in_(room_ids))
+                .returning(Room.id, Room.game_id)
+                .execution_options(synchronize_session=False)
+            )
+        ).all()
+        for room_id, game_id in rooms:
+            counters.add(
+                db=db, game_id=game_id, rooms=-1, players=-members.get(room_id, 0)
+            )
+        await db.commit()
+        removed += len(rooms)
+        for room_id, game_id in rooms:
+            await publish_room(
+                event=RoomEvent.DELETED, room_id=room_id, game_id=game_id, db=db
+            )
+        if len(room_ids) < settings.ROOM_SWEEP_BATCH:
+            break
+    return removed
+
+
+async def sweep_rooms_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.ROOM_SWEEP_INTERVAL)
+        try:
+            async with SessionLocal() as db:
+                if removed := await sweep_rooms(db=db):
+                    logger.info("Room sweeper removed %s rooms", removed)
+        except Exception:
+            logger.exception("Room sweeper failed")
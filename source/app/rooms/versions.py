@@ -0,0 +1,36 @@
+from uuid import uuid4
+
+
+class RoomVersions:
+    def __init__(self):
+        self.token = uuid4().hex[:8]
+        self.epoch = 0
+        self.rooms: dict[int, int] = {}
+        self.lobbies: dict[int | None, int] = {}
+
+    def bump(self, room_id: int, game_id: int | None = None) -> None:
+        self.rooms[room_id] = self.rooms.get(room_id, 0) + 1
+        self.lobbies[None] = self.lobbies.get(None, 0) + 1
+        if game_id is None:
+            self.epoch += 1
+        else:
+            self.lobbies[game_id] = self.lobbies.get(game_id, 0) + 1
+
+    def known(self, room_id: int) -> bool:
+        return room_id in self.rooms
+
+    def seen(self, room_id: int) -> None:
+        self.rooms.setdefault(room_id, 0)
+
+    def reset(self) -> None:
+        self.token = uuid4().hex[:8]
+
+    def room_etag(self, room_id: int) -> str:
+        return f'W/"{self.token}.{room_id}.{self.rooms.get(room_id, 0)}"'
+
+    def lobby_etag(self, game_id: int | None, query: str) -> str:
+        version = self.lobbies.get(game_id, 0)
+        return f'W/"{self.token}.{self.epoch}.{version}.{hash(query) & 0xFFFFFFFF:x}"'
+
+
+versions = RoomVersions()
@@ -1,10 +1,15 @@
-from fastapi import Depends
+import asyncio
+
+from fastapi import Depends, Request, Response
+from fastapi.websockets import WebSocket
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from source.app.auth.auth import CurrentUser
+from source.app.auth.auth import CurrentUser, SocketUser
+from source.app.rooms.feed import feed
 from source.app.rooms.models import Room
 from source.app.rooms.schemas import (
+    QuickJoinRequest,
     RoomDetailResponse,
     RoomId,
     RoomPage,
@@ -20,13 +25,16 @@ from source.app.rooms.services import (
     join_room,
     kick_room,
     list_rooms,
+    quick_join,
     update_room,
 )
+from source.app.rooms.versions import versions
 from source.app.users.schemas import UserId
-from source.core.database import get_db
+from source.core.database import get_db, get_read_db
 from source.core.exceptions import not_found
 from source.core.middlewares import CustomAPIRouter
 from source.core.schemas import ExceptionSchema
+from source.core.utils import check_etag, json_response
 
 rooms_router = CustomAPIRouter(prefix="/rooms")
 
@@ -37,6 +45,7 @@ rooms_router = CustomAPIRouter(prefix="/rooms")
     responses={
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_409_CONFLICT: {"model": ExceptionSchema},
     },
     status_code=status.HTTP_201_CREATED,
     tags=["rooms"],
@@ -53,6 +62,7 @@ async def room_create(
     "/",
     response_model=RoomDetailResponse,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {},
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
     },
@@ -60,8 +70,17 @@ async def room_create(
 )
 async def room_get(
     user: CurrentUser,
-    db: AsyncSession = Depends(get_db),
+    http_request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ) -> Room:
+    if user.room_id:
+        check_etag(
+            request=http_request,
+            response=response,
+            store=not db.info.get("replica"),
+            etag=versions.room_etag(room_id=user.room_id),
+        )
     if user_room := await get_room(room_id=user.room_id, db=db, relation=True):
         return user_room
     return not_found("You are not in the any room")
@@ -104,37 +123,74 @@ async def room_delete(user: CurrentUser, db: AsyncSession = Depends(get_db)) ->
 @rooms_router.get(
     "/list",
     response_model=RoomPage,
-    responses={status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema}},
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+    },
     tags=["rooms"],
 )
 async def rooms_list(
     user: CurrentUser,
+    http_request: Request,
+    response: Response,
     pagination: RoomPagination = Depends(),
-    db: AsyncSession = Depends(get_db),
-) -> RoomPage:
-    return await list_rooms(
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    check_etag(
+        request=http_request,
+        response=response,
+        store=not db.info.get("replica"),
+        etag=versions.lobby_etag(
+            game_id=pagination.game_id, query=str(http_request.url.query)
+        ),
+    )
+    rooms = await list_rooms(
         page=pagination.page,
         size=pagination.size,
         sort=pagination.sort,
         order=pagination.order,
         game_id=pagination.game_id,
+        rank=pagination.rank,
+        search=pagination.search,
         db=db,
     )
+    return json_response(content=rooms, response=response)
 
 
 @rooms_router.get(
     "/look/{room_id}",
     response_model=RoomDetailResponse,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {},
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
     },
     tags=["rooms"],
 )
 async def room_look(
-    user: CurrentUser, request: RoomId = Depends(), db: AsyncSession = Depends(get_db)
+    user: CurrentUser,
+    http_request: Request,
+    response: Response,
+    request: RoomId = Depends(),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Room:
+    store = not db.info.get("replica")
+    if versions.known(room_id=request.room_id):
+        check_etag(
+            request=http_request,
+            response=response,
+            store=store,
+            etag=versions.room_etag(room_id=request.room_id),
+        )
     if room := await get_room(room_id=request.room_id, db=db, relation=True):
+        if store:
+            versions.seen(room_id=request.room_id)
+        check_etag(
+            request=http_request,
+            response=response,
+            store=store,
+            etag=versions.room_etag(room_id=request.room_id),
+        )
         return room
     return not_found(f"Room '{request.room_id}' not found")
 
@@ -159,6 +215,26 @@ async def room_join(
     return not_found(f"Room '{request.room_id}' not found")
 
 
+@rooms_router.post(
+    "/quick-join",
+    response_model=RoomDetailResponse,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_409_CONFLICT: {"model": ExceptionSchema},
+    },
+    tags=["rooms"],
+)
+async def room_quick_join(
+    user: CurrentUser,
+    request: QuickJoinRequest,
+    db: AsyncSession = Depends(get_db),
+) -> Room:
+    if joined_room := await quick_join(request=request, user=user, db=db):
+        return joined_room
+    return not_found(f"You need to create a game profile for game {request.game_id}")
+
+
 @rooms_router.delete(
     "/kick/{user_id}",
     responses={
@@ -176,3 +252,32 @@ async def room_kick(
 ) -> None:
     if not await kick_room(user_id=request.user_id, user=user, db=db):
         return not_found("You are not in the any room")
+
+
+async def send_feed(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    while True:
+        await websocket.send_json(await queue.get())
+
+
+async def receive_until_closed(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@rooms_router.websocket("/feed")
+async def rooms_feed(
+    user: SocketUser, websocket: WebSocket, game_id: int | None = None
+) -> None:
+    await websocket.accept()
+    queue = feed.subscribe(game_id=game_id)
+    tasks = {
+        asyncio.create_task(send_feed(websocket=websocket, queue=queue)),
+        asyncio.create_task(receive_until_closed(websocket=websocket)),
+    }
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        feed.unsubscribe(game_id=game_id, queue=queue)
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class HistogramBucket(BaseModel):
+    le: float | None
+    count: int
+
+
+class PoolStats(BaseModel):
+    pool: str
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    timeouts: int
+    wait_count: int
+    wait_sum: float
+    wait_buckets: list[HistogramBucket]
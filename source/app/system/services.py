@@ -0,0 +1,154 @@
+from math import isinf
+
+from source.app.chat.manager import broadcasts, manager, rooms
+from source.app.games.cache import catalog
+from source.app.profiles.cache import nicknames
+from source.app.rooms.feed import feed
+from source.app.system.schemas import HistogramBucket, PoolStats
+from source.core.database import get_engines, pool_timeouts, pool_wait
+from source.core.metrics import dump, http_latency, http_requests, load, render, workers
+
+
+def family(kind: str, description: str, samples: list[tuple[dict, object]]) -> dict:
+    return {
+        "kind": kind,
+        "description": description,
+        "samples": [[labels, dump(value)] for labels, value in samples],
+    }
+
+
+def collect_metrics() -> dict:
+    pools = [engine.pool for engine in get_engines()]
+    caches = {"games": catalog, "nicknames": nicknames}
+    return {
+        "http_requests_total": family(
+            "counter",
+            "HTTP requests by method, route and status.",
+            http_requests.samples(),
+        ),
+        "http_request_duration_seconds": family(
+            "histogram",
+            "HTTP request latency by method and route.",
+            http_latency.samples(),
+        ),
+        "chat_sockets": family(
+            "gauge",
+            "Open chat websockets by game.",
+            [
+                ({"game_id": str(game_id)}, count)
+                for game_id, count in manager.games.items()
+                if count
+            ],
+        ),
+        "chat_rooms": family(
+            "gauge",
+            "Rooms with at least one open chat websocket on a worker.",
+            [({}, sum(1 for connections in rooms.values() if connections))],
+        ),
+        "chat_messages_broadcast_total": family(
+            "counter",
+            "Chat messages delivered to room members.",
+            [({}, broadcasts)],
+        ),
+        "lobby_feed_subscribers": family(
+            "gauge",
+            "Open lobby feed websockets.",
+            [({}, sum(len(queues) for queues in feed.subscribers.values()))],
+        ),
+        "db_pool_connections": family(
+            "gauge",
+            "Database pool connections by pool and state.",
+            [
+                sample
+                for pool in pools
+                for sample in (
+                    (
+                        {"pool": pool.logging_name, "state": "checked_out"},
+                        pool.checkedout(),
+                    ),
+                    ({"pool": pool.logging_name, "state": "idle"}, pool.checkedin()),
+                    (
+                        {"pool": pool.logging_name, "state": "overflow"},
+                        max(pool.overflow(), 0),
+                    ),
+                )
+            ],
+        ),
+        "db_pool_size": family(
+            "gauge",
+            "Configured database pool size by pool.",
+            [({"pool": pool.logging_name}, pool.size()) for pool in pools],
+        ),
+        "db_pool_checkout_timeouts_total": family(
+            "counter",
+            "Database pool checkouts that timed out by pool.",
+            pool_timeouts.samples(),
+        ),
+        "db_pool_checkout_seconds": family(
+            "histogram",
+            "Time spent waiting for a database connection by pool.",
+            pool_wait.samples(),
+        ),
+        "cache_hits_total": family(
+            "counter",
+            "Cache lookups served from memory.",
+            [({"cache": name}, cache.hits) for name, cache in caches.items()],
+        ),
+        "cache_misses_total": family(
+            "counter",
+            "Cache lookups that went to the database.",
+            [({"cache": name}, cache.misses) for name, cache in caches.items()],
+        ),
+    }
+
+
+def sample(metrics: dict, name: str, **labels: str) -> object:
+    for sample_labels, value in metrics.get(name, {}).get("samples", []):
+        if sample_labels == labels:
+            return load(value)
+    return 0
+
+
+def get_pool_stats() -> list[PoolStats]:
+    metrics = workers.aggregate(snapshot=collect_metrics())
+    names = [labels["pool"] for labels, _ in metrics["db_pool_size"]["samples"]]
+    return [pool_stats(metrics=metrics, pool=name) for name in names]
+
+
+def pool_stats(metrics: dict, pool: str) -> PoolStats:
+    wait = sample(metrics, "db_pool_checkout_seconds", pool=pool)
+    return PoolStats(
+        pool=pool,
+        size=sample(metrics, "db_pool_size", pool=pool),
+        checked_out=sample(
+            metrics, "db_pool_connections", pool=pool, state="checked_out"
+        ),
+        idle=sample(metrics, "db_pool_connections", pool=pool, state="idle"),
+        overflow=sample(metrics, "db_pool_connections", pool=pool, state="overflow"),
+        timeouts=sample(metrics, "db_pool_checkout_timeouts_total", pool=pool),
+        wait_count=wait.count if wait else 0,
+        wait_sum=wait.sum if wait else 0.0,
+        wait_buckets=[
+            HistogramBucket(le=None if isinf(bound) else bound, count=count)
+            for bound, count in (wait.cumulative() if wait else [])
+        ],
+    )
+
+
+def get_chatting(game_id: int) -> int:
+    return sample(
+        workers.cached(collect=collect_metrics), "chat_sockets", game_id=str(game_id)
+    )
+
+
+def get_metrics() -> str:
+    metrics = workers.aggregate(snapshot=collect_metrics())
+    return "".join(
+        render(
+            name,
+            family["kind"],
+            family["description"],
+            [(labels, load(value)) for labels, value in family["samples"]],
+        )
+        for name, family in metrics.items()
+    )
@@ -0,0 +1,21 @@
+import asyncio
+import logging
+
+from source.app.system.services import collect_metrics
+from source.core.metrics import workers
+from source.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def write_metrics_periodically() -> None:
+    try:
+        while True:
+            try:
+                workers.write(snapshot=collect_metrics())
+            except Exception:
+                logger.exception("Metrics snapshot failed")
+            await asyncio.sleep(settings.METRICS_SNAPSHOT_INTERVAL)
+    except asyncio.CancelledError:
+        workers.write(snapshot=collect_metrics())
+        raise
@@ -0,0 +1,33 @@
+from fastapi import Response, status
+
+from source.app.auth.auth import Admin
+from source.app.system.schemas import PoolStats
+from source.app.system.services import get_metrics, get_pool_stats
+from source.core.middlewares import CustomAPIRouter
+from source.core.schemas import ExceptionSchema
+
+system_router = CustomAPIRouter(prefix="/system")
+metrics_router = CustomAPIRouter()
+
+
+@system_router.get(
+    "/pool",
+    response_model=list[PoolStats],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+    },
+    tags=["system"],
+)
+async def pool_get_admin(user: Admin) -> list[PoolStats]:
+    return get_pool_stats()
+
+
+@metrics_router.get(
+    "/metrics",
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"content": {"text/plain": {}}}},
+    tags=["system"],
+)
+async def metrics_get() -> Response:
+    return Response(content=get_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+from typing import AsyncIterator
+
+from source.app.users.services import import_users
+from source.app.users.utils import read_rows
+from source.core.database import SessionLocal
+
+
+async def read_file(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            yield chunk
+
+
+async def import_file(path: str, is_csv: bool) -> None:
+    async with SessionLocal() as db:
+        report = await import_users(
+            rows=read_rows(chunks=read_file(path), is_csv=is_csv), db=db
+        )
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import users")
+    parser.add_argument("path", help="NDJSON or CSV file")
+    parser.add_argument("--csv", action="store_true", help="read the file as CSV")
+    arguments = parser.parse_args()
+    asyncio.run(import_file(path=arguments.path, is_csv=arguments.csv))
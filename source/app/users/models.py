@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from source.core.models import Model
@@ -15,8 +15,18 @@ else:
 
 class User(Model):
     __tablename__ = "Users"
+    __table_args__ = (
+        Index(
+            "ix_Users_username_pattern",
+            "username",
+            postgresql_ops={"username": "text_pattern_ops"},
+        ),
+        Index("ix_Users_role_active_id", "role", "active", "id"),
+    )
 
-    room_id: Mapped[int | None] = mapped_column(ForeignKey("Rooms.id"), index=True)
+    room_id: Mapped[int | None] = mapped_column(
+        ForeignKey("Rooms.id", ondelete="SET NULL"), index=True
+    )
 
     username: Mapped[str] = mapped_column(unique=True, index=True)
     password: Mapped[str]
@@ -27,7 +37,9 @@ class User(Model):
     role: Mapped[str]
     password_timestamp: Mapped[float]
 
-    profiles: Mapped[list[Profile]] = relationship(cascade="all, delete-orphan")
+    profiles: Mapped[list[Profile]] = relationship(
+        cascade="all, delete-orphan", passive_deletes=True
+    )
     room: Mapped[Room] = relationship(
         back_populates="users", primaryjoin="User.room_id == Room.id"
     )
@@ -35,5 +47,6 @@ class User(Model):
         back_populates="owner",
         primaryjoin="User.id == Room.owner_id",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         post_update=True,
     )
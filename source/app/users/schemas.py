@@ -18,7 +18,9 @@ class UserRequest(BaseModel):
 class UserCreate(UserRequest):
     active: bool = True
     role: Roles = Roles.USER
-    password_timestamp: float = Field(default_factory=datetime.utcnow().timestamp)
+    password_timestamp: float = Field(
+        default_factory=lambda: datetime.utcnow().timestamp()
+    )
 
     @model_validator(mode="after")
     def validator(cls, values: "UserCreate") -> "UserCreate":
@@ -61,11 +63,26 @@ class UserUpdate(UserUpdateRequestAdmin):
 
 class UserPage(PageSchema):
     users: list[UserResponse]
+    next_cursor: str | None = None
 
 
 class UserPagination(PaginationSchema):
     sort: Sort = Sort.ID
     order: Order = Order.ASC
+    role: Roles | None = None
+    active: bool | None = None
+    username: str | None = None
+    cursor: str | None = None
+
+
+class UserImportError(BaseModel):
+    row: int
+    error: str
+
+
+class UserImportReport(BaseModel):
+    imported: int = 0
+    errors: list[UserImportError] = []
 
 
 class UserId(BaseModel):
@@ -1,18 +1,39 @@
+from datetime import datetime
 from math import ceil
+from typing import AsyncIterator
 
-from sqlalchemy import asc, desc, select
+from pydantic import ValidationError
+from sqlalchemy import asc, delete, desc, select, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from source.app.users.enums import Order, Sort
+from source.app.auth.utils import hash_passwords
+from source.app.games.stats import counters
+from source.app.profiles.cache import nicknames
+from source.app.profiles.models import Profile
+from source.app.rooms.enums import RoomEvent
+from source.app.rooms.relay import bump_room
+from source.app.rooms.services import count_members, get_room, publish_room
+from source.app.users.enums import Order, Roles, Sort
 from source.app.users.models import User
 from source.app.users.schemas import (
     UserCreate,
+    UserImportError,
+    UserImportReport,
     UserPage,
     UserRequest,
     UserUpdate,
     UserUpdateRequest,
 )
+from source.core.database import count_rows
+from source.core.exceptions import bad_request
+from source.core.settings import settings
+from source.core.utils import (
+    decode_cursor,
+    encode_cursor,
+    escape_like,
+    validation_message,
+)
 
 
 async def create_user(user: UserRequest, db: AsyncSession) -> User | None:
@@ -20,7 +41,6 @@ async def create_user(user: UserRequest, db: AsyncSession) -> User | None:
         user = User(**UserCreate(**user.model_dump()).model_dump())
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         return user
     except IntegrityError:
         return None
@@ -37,29 +57,88 @@ async def update_user(
             if value is not None:
                 setattr(user, key, value)
         await db.commit()
-        await db.refresh(user)
+        if user.room_id:
+            await bump_room(room_id=user.room_id)
         return user
     except IntegrityError:
         return None
 
 
 async def delete_user(user: User, db: AsyncSession) -> None:
-    await db.delete(user)
+    room = await get_room(room_id=user.room_id, db=db)
+    if room:
+        room_id, game_id = room.id, room.game_id
+        event, rooms, players = RoomEvent.OCCUPANCY, 0, -1
+        if room.owner_id == user.id:
+            players = -await count_members(room_id=room_id, db=db)
+            event, rooms = RoomEvent.DELETED, -1
+    game_ids = (
+        await db.scalars(select(Profile.game_id).where(Profile.user_id == user.id))
+    ).all()
+    await db.execute(
+        delete(User)
+        .where(User.id == user.id)
+        .execution_options(synchronize_session=False)
+    )
+    await nicknames.notify(user_id=user.id, db=db)
+    for profile_game_id in game_ids:
+        counters.add(db=db, game_id=profile_game_id, profiles=-1)
+    if room:
+        counters.add(db=db, game_id=game_id, rooms=rooms, players=players)
     await db.commit()
+    nicknames.invalidate(payload=str(user.id))
+    if room:
+        await publish_room(event=event, room_id=room_id, game_id=game_id, db=db)
     return None
 
 
 async def list_users(
-    page: int, size: int, sort: Sort, order: Order, db: AsyncSession
+    page: int,
+    size: int,
+    sort: Sort,
+    order: Order,
+    db: AsyncSession,
+    role: Roles | None = None,
+    active: bool | None = None,
+    username: str | None = None,
+    cursor: str | None = None,
 ) -> UserPage:
-    order = asc(sort) if order == Order.ASC else desc(sort)
+    columns = [User.id] if sort == Sort.ID else [getattr(User, sort), User.id]
+    direction = asc if order == Order.ASC else desc
 
-    users = (
-        await db.scalars(
-            select(User).order_by(order).offset((page - 1) * size).limit(size)
+    query = select(User)
+    if role:
+        query = query.where(User.role == role)
+    if active is not None:
+        query = query.where(User.active == active)
+    if username:
+        query = query.where(
+            User.username.like(f"{escape_like(username)}%", escape="\\")
+        )
+    total = await count_rows(query=query, db=db)
+
+    query = query.order_by(*(direction(column) for column in columns)).limit(size + 1)
+    if cursor:
+        values = decode_cursor(cursor=cursor, length=len(columns))
+        if sort in (Sort.CREATE_DATE, Sort.UPDATE_DATE):
+            try:
+                values[0] = datetime.fromisoformat(values[0])
+            except (TypeError, ValueError):
+                return bad_request("Invalid cursor")
+        key = tuple_(*columns)
+        query = query.where(
+            key > tuple(values) if order == Order.ASC else key < tuple(values)
+        )
+    else:
+        query = query.offset((page - 1) * size)
+
+    users = (await db.scalars(query)).all()
+    next_cursor = None
+    if len(users) > size:
+        users = users[:size]
+        next_cursor = encode_cursor(
+            *(getattr(users[-1], column.key) for column in columns)
         )
-    ).all()
-    total = len(users)
 
     return UserPage(
         users=users,
@@ -67,4 +146,100 @@ async def list_users(
         size=size,
         total=total,
         pages=(ceil(total / size)),
+        next_cursor=next_cursor,
     )
+
+
+async def import_user_chunk(
+    users: list[tuple[int, UserRequest]], report: UserImportReport, db: AsyncSession
+) -> None:
+    passwords = await hash_passwords([user.password for _, user in users])
+    now = datetime.utcnow()
+    columns = [
+        "username",
+        "password",
+        "email",
+        "first_name",
+        "last_name",
+        "active",
+        "role",
+        "password_timestamp",
+        "create_date",
+        "update_date",
+    ]
+    records = [
+        (
+            user.username,
+            password,
+            user.email,
+            user.first_name,
+            user.last_name,
+            True,
+            Roles.USER.value,
+            now.timestamp(),
+            now,
+            now,
+        )
+        for (_, user), password in zip(users, passwords)
+    ]
+
+    connection = await (await db.connection()).get_raw_connection()
+    driver = connection.driver_connection
+    await driver.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS users_import ("
+        "username varchar, password varchar, email varchar, "
+        "first_name varchar, last_name varchar, active boolean, role varchar, "
+        "password_timestamp float8, create_date timestamp, update_date timestamp"
+        ") ON COMMIT DROP"
+    )
+    await driver.copy_records_to_table("users_import", records=records, columns=columns)
+    inserted = await driver.fetch(
+        f'INSERT INTO "Users" ({", ".join(columns)}) '
+        f'SELECT {", ".join(columns)} FROM users_import '
+        "ON CONFLICT (username) DO NOTHING RETURNING username"
+    )
+    await db.commit()
+
+    usernames = {row["username"] for row in inserted}
+    report.imported += len(usernames)
+    for number, user in users:
+        if user.username not in usernames:
+            report.errors.append(
+                UserImportError(
+                    row=number, error=f"User '{user.username}' already exists"
+                )
+            )
+
+
+async def import_users(
+    rows: AsyncIterator[str | dict], db: AsyncSession
+) -> UserImportReport:
+    report = UserImportReport()
+    users: list[tuple[int, UserRequest]] = []
+    usernames: set[str] = set()
+    number = 0
+    async for row in rows:
+        number += 1
+        try:
+            if isinstance(row, str):
+                user = UserRequest.model_validate_json(row)
+            else:
+                user = UserRequest.model_validate(row)
+        except ValidationError as error:
+            report.errors.append(
+                UserImportError(row=number, error=validation_message(error))
+            )
+            continue
+        if user.username in usernames:
+            report.errors.append(
+                UserImportError(row=number, error=f"Duplicate user '{user.username}'")
+            )
+            continue
+        usernames.add(user.username)
+        users.append((number, user))
+        if len(users) >= settings.USER_IMPORT_CHUNK:
+            await import_user_chunk(users=users, report=report, db=db)
+            users, usernames = [], set()
+    if users:
+        await import_user_chunk(users=users, report=report, db=db)
+    return report
@@ -1,6 +1,9 @@
+import csv
+from collections import deque
+from typing import AsyncIterator
+
 from sqlalchemy import exists, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from source.app.users.enums import Roles
 from source.app.users.models import User
@@ -9,21 +12,58 @@ from source.core.database import SessionLocal
 from source.core.settings import settings
 
 
-async def create_admin(db: AsyncSession = SessionLocal()):
-    admin_user = User(
-        **UserCreate(
-            username=settings.ADMIN_USERNAME,
-            password=settings.ADMIN_PASSWORD,
-            email=settings.ADMIN_EMAIL,
-            role=Roles.ADMIN,
-        ).model_dump()
-    )
-    try:
-        if not await db.scalar(select(exists().where(User.role == Roles.ADMIN))):
-            db.add(admin_user)
+async def create_admin() -> None:
+    async with SessionLocal() as db:
+        if await db.scalar(select(exists().where(User.role == Roles.ADMIN))):
+            return
+        db.add(
+            User(
+                **UserCreate(
+                    username=settings.ADMIN_USERNAME,
+                    password=settings.ADMIN_PASSWORD,
+                    email=settings.ADMIN_EMAIL,
+                    role=Roles.ADMIN,
+                ).model_dump()
+            )
+        )
+        try:
             await db.commit()
-            await db.refresh(admin_user)
-    except IntegrityError:
-        pass
-    finally:
-        await db.close()
+        except IntegrityError:
+            pass
+
+
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    buffer = b""
+    async for chunk in chunks:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            yield line.decode()
+    yield buffer.decode()
+
+
+async def read_rows(
+    chunks: AsyncIterator[bytes], is_csv: bool = False
+) -> AsyncIterator[str | dict]:
+    header = None
+    lines: deque[str] = deque()
+    reader = csv.reader(iter(lambda: lines.popleft() if lines else None, None))
+    quotes = 0
+    async for line in read_lines(chunks):
+        if not lines and not line.strip():
+            continue
+        if not is_csv:
+            yield line
+            continue
+        lines.append(line + "\n")
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        quotes = 0
+        values = next(reader)
+        if header is None:
+            header = values
+        else:
+            yield {key: value or None for key, value in zip(header, values)}
+    if lines and header is not None:
+        values = next(reader)
+        yield {key: value or None for key, value in zip(header, values)}
@@ -1,20 +1,29 @@
-from fastapi import Depends, status
+from fastapi import Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from source.app.auth.auth import Admin, CurrentUser
 from source.app.users.models import User
 from source.app.users.schemas import (
+    UserImportReport,
     UserPage,
     UserPagination,
     UserRequest,
     UserResponse,
     UserUpdateRequest,
 )
-from source.app.users.services import create_user, delete_user, list_users, update_user
+from source.app.users.services import (
+    create_user,
+    delete_user,
+    import_users,
+    list_users,
+    update_user,
+)
+from source.app.users.utils import read_rows
 from source.core.database import get_db
 from source.core.exceptions import conflict
 from source.core.middlewares import CustomAPIRouter
 from source.core.schemas import ExceptionSchema
+from source.core.utils import json_response
 
 users_router = CustomAPIRouter(prefix="/users")
 
@@ -85,11 +94,36 @@ async def users_list_admin(
     user: Admin,
     pagination: UserPagination = Depends(),
     db: AsyncSession = Depends(get_db),
-) -> UserPage:
-    return await list_users(
+) -> Response:
+    users = await list_users(
         page=pagination.page,
         size=pagination.size,
         sort=pagination.sort,
         order=pagination.order,
+        role=pagination.role,
+        active=pagination.active,
+        username=pagination.username,
+        cursor=pagination.cursor,
         db=db,
     )
+    return json_response(content=users)
+
+
+@users_router.post(
+    "/admin/import",
+    response_model=UserImportReport,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+    },
+    tags=["users"],
+)
+async def users_import_admin(
+    user: Admin,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> UserImportReport:
+    is_csv = request.headers.get("Content-Type", "").startswith("text/csv")
+    return await import_users(
+        rows=read_rows(chunks=request.stream(), is_csv=is_csv), db=db
+    )
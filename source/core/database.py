@@ -1,13 +1,130 @@
-from typing import Any, AsyncGenerator
+import asyncio
+import json
+from functools import cache, cached_property
+from itertools import count
+from math import inf
+from time import perf_counter
+from typing import Any, AsyncGenerator, Callable
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import Select, bindparam, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from source.core.instrumentation import instrument
+from source.core.metrics import Counter, Family, Histogram
 from source.core.settings import settings
 
-engine = create_async_engine(f"postgresql+asyncpg://{settings.POSTGRES_URI}")
-SessionLocal = async_sessionmaker(bind=engine)
+pool_wait = Family(Histogram)
+pool_timeouts = Family(Counter)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def connect(self):
+        start = perf_counter()
+        try:
+            return super().connect()
+        except TimeoutError:
+            pool_timeouts.labels(pool=self.logging_name).inc()
+            raise
+        finally:
+            pool_wait.labels(pool=self.logging_name).observe(perf_counter() - start)
+
+
+def make_engine(uri: str, name: str) -> AsyncEngine:
+    engine = create_async_engine(
+        f"postgresql+asyncpg://{uri}"
+        f"?prepared_statement_cache_size={settings.PREPARED_STATEMENT_CACHE_SIZE}",
+        poolclass=InstrumentedPool,
+        pool_logging_name=name,
+        pool_size=settings.POOL_SIZE,
+        max_overflow=settings.POOL_MAX_OVERFLOW,
+        pool_timeout=settings.POOL_TIMEOUT,
+        pool_recycle=settings.POOL_RECYCLE,
+        pool_pre_ping=settings.POOL_PRE_PING,
+        pool_use_lifo=settings.POOL_USE_LIFO,
+        connect_args={
+            "statement_cache_size": settings.STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.COMMAND_TIMEOUT,
+        },
+    )
+    instrument(engine.sync_engine)
+    return engine
+
+
+class LazySessionMaker(async_sessionmaker):
+    def __init__(self, get_bind: Callable[[], AsyncEngine], **kw: Any):
+        super().__init__(**kw)
+        self.get_bind = get_bind
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if self.kw["bind"] is None:
+            self.configure(bind=self.get_bind())
+        return super().__call__(**local_kw)
+
+
+class Replica:
+    def __init__(self, uri: str, name: str):
+        self.uri = uri
+        self.name = name
+        self.sessions = LazySessionMaker(
+            get_bind=lambda: self.engine, expire_on_commit=False, info={"replica": True}
+        )
+        self.lag = inf
+
+    @cached_property
+    def engine(self) -> AsyncEngine:
+        return make_engine(uri=self.uri, name=self.name)
+
+    async def probe(self) -> None:
+        try:
+            async with self.engine.connect() as connection:
+                self.lag = float(await connection.scalar(REPLICA_LAG))
+        except Exception:
+            self.lag = inf
+
+
+REPLICA_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+READ_PRIMARY_COOKIE = "read_primary"
+
+
+@cache
+def get_engine() -> AsyncEngine:
+    return make_engine(uri=settings.POSTGRES_URI, name="primary")
+
+
+SessionLocal = LazySessionMaker(get_bind=get_engine, expire_on_commit=False)
+replicas = [
+    Replica(uri=uri, name=f"replica{index}")
+    for index, uri in enumerate(settings.POSTGRES_REPLICA_URIS)
+]
+
+
+def get_engines() -> list[AsyncEngine]:
+    engines = [get_engine()] if get_engine.cache_info().currsize else []
+    return engines + [
+        replica.engine for replica in replicas if "engine" in replica.__dict__
+    ]
+
+
+async def dispose_engines() -> None:
+    for engine in get_engines():
+        await engine.dispose()
+
+
+replica_turns = count()
 Base = declarative_base()
 
 
@@ -19,9 +136,50 @@ async def get_db() -> AsyncGenerator[AsyncSession, Any]:
         await db.close()
 
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, Any]:
+    healthy = [
+        replica for replica in replicas if replica.lag <= settings.REPLICA_MAX_LAG
+    ]
+    if healthy and READ_PRIMARY_COOKIE not in request.cookies:
+        db = healthy[next(replica_turns) % len(healthy)].sessions()
+    else:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def probe_replicas() -> None:
+    while True:
+        await asyncio.gather(*(replica.probe() for replica in replicas))
+        await asyncio.sleep(settings.REPLICA_PROBE_INTERVAL)
+
+
 async def database_health(db: AsyncSession) -> bool:
     try:
         await db.execute(select(1))
         return True
     except Exception:
         return False
+
+
+async def count_rows(query: Select, db: AsyncSession) -> int:
+    query = query.order_by(None).limit(None).offset(None)
+    statement = query.compile(
+        dialect=postgresql.dialect(paramstyle="named"),
+        compile_kwargs={"render_postcompile": True},
+    )
+    explain = text(f"EXPLAIN (FORMAT JSON) {statement}").bindparams(
+        *(
+            bindparam(name, value, type_=statement.binds[name].type)
+            if name in statement.binds
+            else bindparam(name, value)
+            for name, value in statement.params.items()
+        )
+    )
+    plan = await db.scalar(explain)
+    estimate = int(json.loads(plan)[0]["Plan"]["Plan Rows"])
+    if estimate > settings.EXACT_COUNT_LIMIT:
+        return estimate
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
@@ -35,3 +35,10 @@ def conflict(detail: str):
         status_code=status.HTTP_409_CONFLICT,
         detail=detail,
     )
+
+
+def not_modified(etag: str):
+    raise HTTPException(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag},
+    )
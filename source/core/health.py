@@ -0,0 +1,52 @@
+import asyncio
+from time import monotonic, perf_counter
+
+from source.core.database import SessionLocal, database_health, get_engine
+from source.core.settings import settings
+
+
+class HealthProbe:
+    def __init__(self):
+        self.database = False
+        self.pool_saturation = 0.0
+        self.loop_lag = 0.0
+        self.checked_at: float | None = None
+
+    def fresh(self) -> bool:
+        return (
+            self.checked_at is not None
+            and monotonic() - self.checked_at < 3 * settings.HEALTH_PROBE_INTERVAL
+        )
+
+    def ready(self) -> bool:
+        return (
+            self.fresh()
+            and self.database
+            and self.pool_saturation < settings.HEALTH_MAX_POOL_SATURATION
+            and self.loop_lag < settings.HEALTH_MAX_LOOP_LAG
+        )
+
+    async def check_database(self) -> bool:
+        try:
+            async with SessionLocal() as db:
+                return await asyncio.wait_for(
+                    database_health(db=db), timeout=settings.HEALTH_DB_TIMEOUT
+                )
+        except Exception:
+            return False
+
+    async def run(self) -> None:
+        while True:
+            pool = get_engine().pool
+            capacity = pool.size() + max(settings.POOL_MAX_OVERFLOW, 0)
+            self.pool_saturation = pool.checkedout() / capacity if capacity else 0.0
+            self.database = await self.check_database()
+            self.checked_at = monotonic()
+            start = perf_counter()
+            await asyncio.sleep(settings.HEALTH_PROBE_INTERVAL)
+            self.loop_lag = max(
+                perf_counter() - start - settings.HEALTH_PROBE_INTERVAL, 0.0
+            )
+
+
+probe = HealthProbe()
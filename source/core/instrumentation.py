@@ -0,0 +1,63 @@
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from source.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_start = perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if stats := query_stats.get():
+        stats.record(statement=statement, duration=perf_counter() - context.query_start)
+
+
+def instrument(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def check_budget(route: str, stats: QueryStats) -> None:
+    if settings.QUERY_BUDGET_MODE == "off":
+        return
+    problems = []
+    budget = settings.QUERY_BUDGETS.get(route, settings.QUERY_BUDGET)
+    if stats.count > budget:
+        problems.append(f"{stats.count} queries over a budget of {budget}")
+    for statement, count in stats.statements.items():
+        if count > settings.QUERY_REPEAT_LIMIT:
+            shape = " ".join(statement.split())[:200]
+            problems.append(f"{count} executions of {shape}")
+    if not problems:
+        return
+    message = f"{route}: {'; '.join(problems)}"
+    if settings.QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceeded(message)
+    logger.warning("Query budget exceeded for %s", message)
@@ -0,0 +1,207 @@
+import fcntl
+import json
+import os
+from bisect import bisect_left
+from math import isinf
+from pathlib import Path
+from time import monotonic
+from typing import Callable, Iterable
+
+from source.core.settings import settings
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        total, result = 0, []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class Family:
+    def __init__(self, metric: type[Counter] | type[Histogram]):
+        self.metric = metric
+        self.children: dict[tuple, Counter | Histogram] = {}
+
+    def labels(self, **labels: str) -> Counter | Histogram:
+        key = tuple(labels.items())
+        if (child := self.children.get(key)) is None:
+            child = self.children[key] = self.metric()
+        return child
+
+    def samples(self) -> list[tuple[dict, Counter | Histogram]]:
+        return [(dict(key), child) for key, child in self.children.items()]
+
+
+http_requests = Family(Counter)
+http_latency = Family(Histogram)
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = (
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(pairs) + "}"
+
+
+def render(
+    name: str, kind: str, description: str, samples: Iterable[tuple[dict, object]]
+) -> str:
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        if isinstance(value, Histogram):
+            for bound, count in value.cumulative():
+                le = "+Inf" if isinf(bound) else repr(bound)
+                lines.append(
+                    f"{name}_bucket{format_labels({**labels, 'le': le})} {count}"
+                )
+            lines.append(f"{name}_sum{format_labels(labels)} {value.sum}")
+            lines.append(f"{name}_count{format_labels(labels)} {value.count}")
+        elif isinstance(value, Counter):
+            lines.append(f"{name}{format_labels(labels)} {value.value}")
+        else:
+            lines.append(f"{name}{format_labels(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(value: object) -> object:
+    if isinstance(value, Histogram):
+        return {
+            "buckets": list(value.buckets),
+            "counts": value.counts,
+            "sum": value.sum,
+            "count": value.count,
+        }
+    if isinstance(value, Counter):
+        return value.value
+    return value
+
+
+def load(value: object) -> object:
+    if isinstance(value, dict):
+        histogram = Histogram(buckets=tuple(value["buckets"]))
+        histogram.counts = list(value["counts"])
+        histogram.sum, histogram.count = value["sum"], value["count"]
+        return histogram
+    return value
+
+
+def combine(left: object, right: object) -> object:
+    if isinstance(left, dict) and isinstance(right, dict):
+        return {
+            "buckets": left["buckets"],
+            "counts": [a + b for a, b in zip(left["counts"], right["counts"])],
+            "sum": left["sum"] + right["sum"],
+            "count": left["count"] + right["count"],
+        }
+    return left + right
+
+
+def merge(snapshots: Iterable[dict], kinds: tuple[str, ...] | None = None) -> dict:
+    merged: dict = {}
+    for snapshot in snapshots:
+        for name, family in snapshot.items():
+            if kinds is not None and family["kind"] not in kinds:
+                continue
+            target = merged.setdefault(
+                name,
+                {"kind": family["kind"], "description": family["description"]},
+            )
+            samples = {
+                json.dumps(labels, sort_keys=True): [labels, value]
+                for labels, value in target.get("samples", [])
+            }
+            for labels, value in family["samples"]:
+                key = json.dumps(labels, sort_keys=True)
+                if key in samples:
+                    samples[key][1] = combine(samples[key][1], value)
+                else:
+                    samples[key] = [labels, value]
+            target["samples"] = list(samples.values())
+    return merged
+
+
+def alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkerMetrics:
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.latest: dict = {}
+        self.collected_at = 0.0
+
+    def read(self, path: Path) -> dict:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def write(self, snapshot: dict, name: str | None = None) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / (name or f"{os.getpid()}.json")
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(snapshot))
+        os.replace(temporary, path)
+
+    def aggregate(self, snapshot: dict) -> dict:
+        self.write(snapshot=snapshot)
+        with open(self.directory / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            archive = self.read(self.directory / "archive.json")
+            snapshots = []
+            for path in self.directory.glob("*.json"):
+                if not path.stem.isdigit():
+                    continue
+                if alive(int(path.stem)):
+                    snapshots.append(self.read(path))
+                    continue
+                archive = merge(
+                    [archive, self.read(path)], kinds=("counter", "histogram")
+                )
+                path.unlink(missing_ok=True)
+            self.write(snapshot=archive, name="archive.json")
+        self.latest, self.collected_at = merge([archive, *snapshots]), monotonic()
+        return self.latest
+
+    def cached(self, collect: Callable[[], dict]) -> dict:
+        if monotonic() - self.collected_at > settings.METRICS_SNAPSHOT_INTERVAL:
+            return self.aggregate(snapshot=collect())
+        return self.latest
+
+
+workers = WorkerMetrics(directory=settings.METRICS_DIR)
@@ -1,3 +1,5 @@
+import logging
+from time import perf_counter
 from typing import Any, Callable
 
 from fastapi import APIRouter
@@ -5,6 +7,11 @@ from fastapi.types import DecoratedCallable
 from starlette.datastructures import MutableHeaders
 from starlette.websockets import WebSocket
 
+from source.core.database import READ_PRIMARY_COOKIE, replicas
+from source.core.instrumentation import QueryStats, check_budget, query_stats
+from source.core.metrics import http_latency, http_requests
+from source.core.settings import settings
+
 
 class WebSocketMiddleware:
     def __init__(self, app):
@@ -21,6 +28,104 @@ class WebSocketMiddleware:
         await self.app(scope, receive, send)
 
 
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def send_observed(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_observed)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            http_latency.labels(method=method, route=route).observe(
+                perf_counter() - start
+            )
+            http_requests.labels(method=method, route=route, status=str(status)).inc()
+
+
+class QueryTimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats()
+
+        async def send_timed(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        token = query_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            query_stats.reset(token)
+        route = (
+            f"{scope['method']} {getattr(scope.get('route'), 'path', scope['path'])}"
+        )
+        logger.info(
+            "%s ran %s queries in %.1fms",
+            route,
+            stats.count,
+            stats.duration * 1000,
+            extra={
+                "route": route,
+                "queries": stats.count,
+                "db_ms": round(stats.duration * 1000, 1),
+            },
+        )
+        check_budget(route=route, stats=stats)
+
+
+class ReadYourWritesMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not replicas
+            or scope["type"] != "http"
+            or scope["method"] in ("GET", "HEAD", "OPTIONS")
+        ):
+            return await self.app(scope, receive, send)
+
+        async def send_pinned(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{READ_PRIMARY_COOKIE}=1; Max-Age="
+                    f"{settings.READ_YOUR_WRITES_SECONDS}; Path=/; HttpOnly; "
+                    "SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_pinned)
+
+
 class CustomAPIRouter(APIRouter):
     """https://github.com/tiangolo/fastapi/issues/2060#issuecomment-834868906"""
 
@@ -10,6 +10,7 @@ class Base(DeclarativeBase):
 
 class Model(Base):
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(
         primary_key=True, autoincrement=True, unique=True, index=True, sort_order=-1
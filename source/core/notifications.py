@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import Callable
+from uuid import uuid4
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+handlers: dict[str, list[Callable[[str | None], None]]] = {}
+origin = uuid4().hex[:12]
+connection: asyncpg.Connection | None = None
+lock = asyncio.Lock()
+
+
+def listen(channel: str, handler: Callable[[str | None], None]) -> None:
+    handlers.setdefault(channel, []).append(handler)
+
+
+async def notify(channel: str, payload: str, db: AsyncSession) -> None:
+    await db.execute(select(func.pg_notify(channel, payload)))
+
+
+def connected() -> bool:
+    return connection is not None and not connection.is_closed()
+
+
+async def publish(channel: str, payload: str) -> bool:
+    if not connected():
+        return False
+    try:
+        async with lock:
+            await connection.execute("SELECT pg_notify($1, $2)", channel, payload)
+    except Exception:
+        logger.warning("Notification on %s dropped", channel, exc_info=True)
+        return False
+    return True
+
+
+def dispatch(connection, pid: int, channel: str, payload: str | None) -> None:
+    for handler in handlers.get(channel, []):
+        handler(payload)
+
+
+async def listen_notifications() -> None:
+    global connection
+    while True:
+        try:
+            listener = await asyncpg.connect(f"postgresql://{settings.POSTGRES_URI}")
+            try:
+                closed = asyncio.Event()
+                listener.add_termination_listener(lambda _: closed.set())
+                for channel in handlers:
+                    await listener.add_listener(channel, dispatch)
+                    dispatch(listener, 0, channel, None)
+                connection = listener
+                await closed.wait()
+            finally:
+                connection = None
+                await listener.close()
+        except Exception:
+            logger.exception("Notification listener disconnected")
+        await asyncio.sleep(settings.NOTIFY_RECONNECT_INTERVAL)
@@ -35,6 +35,20 @@ class PaginationSchema(BaseModel):
             )
 
 
+class CursorPaginationSchema(BaseModel):
+    size: int = Field(default=50, ge=1)
+    cursor: str | None = None
+
+    def __init__(self, **data: Any) -> None:
+        try:
+            super(CursorPaginationSchema, self).__init__(**data)
+        except ValidationError as error:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=error.errors(),
+            )
+
+
 class ExceptionSchema(BaseModel):
     detail: str
 
@@ -42,3 +56,10 @@ class ExceptionSchema(BaseModel):
 class HealthSchema(BaseModel):
     api: bool
     database: bool
+
+
+class ReadinessSchema(BaseModel):
+    ready: bool
+    database: bool
+    pool_saturation: float
+    loop_lag: float
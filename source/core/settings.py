@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
@@ -6,6 +8,18 @@ class Settings(BaseSettings):
     APP_TITLE: str = "Play2Gether"
     VERSION: str = "1.0.0"
 
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None
+    SERVER_RELOAD: bool = False
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEP_ALIVE: int = 5
+    SERVER_MAX_CONCURRENCY: int | None = None
+    SERVER_MAX_REQUESTS: int | None = None
+    SERVER_GRACEFUL_SHUTDOWN: int | None = 30
+    SERVER_WS_PING_INTERVAL: float | None = 20.0
+    SERVER_WS_PING_TIMEOUT: float | None = 20.0
+
     ADMIN_USERNAME: str = "admin"
     ADMIN_PASSWORD: str = "123456"
     ADMIN_EMAIL: str = "admin@admin.admin"
@@ -14,6 +28,7 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
     SECRET_KEY: str = "s3cr3t_k3y"
     ALGORITHM: str = "HS256"
+    PASSWORD_HASH_WORKERS: int | None = None
 
     POSTGRES_USER: str = "user"
     POSTGRES_PASSWORD: str = "password"
@@ -21,6 +36,54 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "postgres"
     POSTGRES_PORT: int = 5432
     POSTGRES_URI: str | None = None
+    POSTGRES_REPLICA_HOSTS: list[str] = []
+    POSTGRES_REPLICA_URIS: list[str] = []
+    REPLICA_MAX_LAG: float = 5.0
+    REPLICA_PROBE_INTERVAL: float = 1.0
+    READ_YOUR_WRITES_SECONDS: int = 10
+    POOL_SIZE: int = 5
+    POOL_MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0
+    POOL_RECYCLE: int = -1
+    POOL_PRE_PING: bool = False
+    POOL_USE_LIFO: bool = False
+    STATEMENT_CACHE_SIZE: int = 100
+    PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    COMMAND_TIMEOUT: float | None = None
+    NOTIFY_RECONNECT_INTERVAL: float = 5.0
+    EXACT_COUNT_LIMIT: int = 10000
+
+    METRICS_DIR: str = "/tmp/play2gether-metrics"
+    METRICS_SNAPSHOT_INTERVAL: float = 5.0
+
+    HEALTH_PROBE_INTERVAL: float = 2.0
+    HEALTH_DB_TIMEOUT: float = 2.0
+    HEALTH_MAX_POOL_SATURATION: float = 0.9
+    HEALTH_MAX_LOOP_LAG: float = 0.5
+
+    QUERY_BUDGET_MODE: Literal["off", "log", "raise"] = "log"
+    QUERY_BUDGET: int = 20
+    QUERY_BUDGETS: dict[str, int] = {}
+    QUERY_REPEAT_LIMIT: int = 5
+
+    USER_IMPORT_CHUNK: int = 5000
+    EXPORT_CHUNK: int = 1000
+
+    GAMES_CACHE_TTL: int = 300
+    GAMES_CACHE_PAGES: int = 1024
+    GAMES_STATS_FLUSH_INTERVAL: float = 5.0
+    GAMES_STATS_RECONCILE_INTERVAL: int = 600
+
+    PROFILE_CACHE_SIZE: int = 100000
+
+    LOBBY_FEED_INTERVAL: float = 1.0
+    LOBBY_FEED_QUEUE_SIZE: int = 100
+    CHAT_MESSAGE_MAX_BYTES: int = 2000
+    MATCHMAKING_ATTEMPTS: int = 3
+
+    ROOM_SWEEP_INTERVAL: int = 60
+    ROOM_SWEEP_GRACE: int = 300
+    ROOM_SWEEP_BATCH: int = 500
 
     @model_validator(mode="after")
     def validator(cls, values: "Settings") -> "Settings":
@@ -28,6 +91,12 @@ class Settings(BaseSettings):
             f"{values.POSTGRES_USER}:{values.POSTGRES_PASSWORD}@"
             f"{values.POSTGRES_HOST}:{values.POSTGRES_PORT}/{values.POSTGRES_DB}"
         )
+        values.POSTGRES_REPLICA_URIS = [
+            f"{values.POSTGRES_USER}:{values.POSTGRES_PASSWORD}@"
+            f"{host if ':' in host else f'{host}:{values.POSTGRES_PORT}'}/"
+            f"{values.POSTGRES_DB}"
+            for host in values.POSTGRES_REPLICA_HOSTS
+        ]
         return values
 
 
@@ -0,0 +1,41 @@
+import logging
+import os
+from contextlib import contextmanager
+from time import monotonic, perf_counter
+from typing import Iterator
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def process_age() -> float | None:
+    try:
+        with open("/proc/self/stat") as stat:
+            start_ticks = int(stat.read().rsplit(")", 1)[1].split()[19])
+        return monotonic() - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupReport:
+    def __init__(self):
+        self.phases: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, perf_counter() - start))
+
+    def boot(self) -> None:
+        if (age := process_age()) is not None:
+            self.phases.append(("boot", age))
+
+    def log(self) -> None:
+        total = sum(duration for _, duration in self.phases)
+        phases = ", ".join(f"{name} {duration:.3f}s" for name, duration in self.phases)
+        logger.info("Startup took %.3fs (%s)", total, phases)
+
+
+report = StartupReport()
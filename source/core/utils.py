@@ -0,0 +1,79 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error
+from hashlib import sha1
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import BaseModel, ValidationError
+
+from source.core import notifications
+from source.core.exceptions import bad_request, not_modified
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def check_etag(
+    request: Request, response: Response, etag: str, store: bool = True
+) -> None:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and notifications.connected():
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return not_modified(etag)
+    if store:
+        response.headers["ETag"] = etag
+
+
+def json_response(content: BaseModel, response: Response | None = None) -> Response:
+    json_content = Response(
+        content=content.model_dump_json(by_alias=True), media_type="application/json"
+    )
+    if response is not None:
+        json_content.raw_headers.extend(response.raw_headers)
+    return json_content
+
+
+def accepts_encoding(header: str, encoding: str) -> bool:
+    weights = {}
+    for entry in header.split(","):
+        name, _, params = entry.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+    return weights.get(encoding, weights.get("*", 0.0)) > 0
+
+
+def make_etag(content: bytes) -> str:
+    return f'W/"{sha1(content).hexdigest()[:16]}"'
+
+
+def encode_cursor(*values: Any) -> str:
+    return urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (Error, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != length:
+        return bad_request("Invalid cursor")
+    return values
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+        if detail["loc"]
+        else detail["msg"]
+        for detail in error.errors()
+    )
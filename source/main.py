@@ -1,21 +1,49 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from source.app.games.tasks import maintain_stats_periodically
+from source.app.rooms.tasks import sweep_rooms_periodically
+from source.app.system.tasks import write_metrics_periodically
 from source.app.users.utils import create_admin
-from source.core.database import database_health, get_db
-from source.core.middlewares import WebSocketMiddleware
+from source.core.database import dispose_engines, probe_replicas, replicas
+from source.core.health import probe
+from source.core.middlewares import (
+    MetricsMiddleware,
+    QueryTimingMiddleware,
+    ReadYourWritesMiddleware,
+    WebSocketMiddleware,
+)
+from source.core.notifications import listen_notifications
 from source.core.routers import api_router
-from source.core.schemas import HealthSchema
+from source.core.schemas import HealthSchema, ReadinessSchema
 from source.core.settings import settings
+from source.core.startup import report
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await create_admin()
+    report.boot()
+    with report.phase("admin"):
+        await create_admin()
+    with report.phase("tasks"):
+        tasks = [
+            asyncio.create_task(probe.run()),
+            asyncio.create_task(listen_notifications()),
+            asyncio.create_task(sweep_rooms_periodically()),
+            asyncio.create_task(maintain_stats_periodically()),
+            asyncio.create_task(write_metrics_periodically()),
+        ]
+        if replicas:
+            tasks.append(asyncio.create_task(probe_replicas()))
+    report.log()
     yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await dispose_engines()
 
 
 app = FastAPI(title=settings.APP_TITLE, version=settings.VERSION, lifespan=lifespan)
@@ -33,8 +61,34 @@ app.add_middleware(
 )
 
 app.add_middleware(WebSocketMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(QueryTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/", response_model=HealthSchema, tags=["health"])
-async def health_check(db: AsyncSession = Depends(get_db)):
-    return {"api": True, "database": await database_health(db=db)}
+async def health_check():
+    return {"api": True, "database": probe.database}
+
+
+@app.get("/health/live", response_model=HealthSchema, tags=["health"])
+async def health_live():
+    return {"api": True, "database": probe.database}
+
+
+@app.get(
+    "/health/ready",
+    response_model=ReadinessSchema,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessSchema}},
+    tags=["health"],
+)
+async def health_ready(response: Response):
+    ready = probe.ready()
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "ready": ready,
+        "database": probe.database,
+        "pool_saturation": probe.pool_saturation,
+        "loop_lag": probe.loop_lag,
+    }
@@ -0,0 +1,46 @@
+"""room filters
+
+Revision ID: 00003
+Revises: 00002
+Create Date: 2026-10-19 12:03:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "00003"
+down_revision = "00002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_Rooms_room_ranks",
+            "Rooms",
+            ["room_ranks"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_Rooms_room_name_trgm",
+            "Rooms",
+            ["room_name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"room_name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_Rooms_room_name_trgm", table_name="Rooms", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_Rooms_room_ranks", table_name="Rooms", postgresql_concurrently=True
+        )
@@ -0,0 +1,45 @@
+"""user filters
+
+Revision ID: 00004
+Revises: 00003
+Create Date: 2026-10-19 12:04:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "00004"
+down_revision = "00003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_Users_username_pattern",
+            "Users",
+            ["username"],
+            unique=False,
+            postgresql_ops={"username": "text_pattern_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_Users_role_active_id",
+            "Users",
+            ["role", "active", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_Users_role_active_id", table_name="Users", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_Users_username_pattern",
+            table_name="Users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,47 @@
+"""profile search
+
+Revision ID: 00005
+Revises: 00004
+Create Date: 2026-10-19 12:05:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "00005"
+down_revision = "00004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_Profiles_game_id_user_rank_id",
+            "Profiles",
+            ["game_id", "user_rank", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_Profiles_game_id_user_nickname",
+            "Profiles",
+            ["game_id", "user_nickname"],
+            unique=False,
+            postgresql_ops={"user_nickname": "text_pattern_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_Profiles_game_id_user_nickname",
+            table_name="Profiles",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_Profiles_game_id_user_rank_id",
+            table_name="Profiles",
+            postgresql_concurrently=True,
+        )
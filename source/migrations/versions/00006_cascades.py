@@ -0,0 +1,45 @@
+"""cascades
+
+Revision ID: 00006
+Revises: 00005
+Create Date: 2026-10-19 12:06:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "00006"
+down_revision = "00005"
+branch_labels = None
+depends_on = None
+
+foreign_keys = [
+    ("Profiles_user_id_fkey", "Profiles", "Users", "user_id", "CASCADE"),
+    ("Profiles_game_id_fkey", "Profiles", "Games", "game_id", "CASCADE"),
+    ("Rooms_game_id_fkey", "Rooms", "Games", "game_id", "CASCADE"),
+    ("Rooms_owner_id_fkey", "Rooms", "Users", "owner_id", "CASCADE"),
+    ("Users_room_id_fkey", "Users", "Rooms", "room_id", "SET NULL"),
+]
+
+
+def upgrade() -> None:
+    for name, source, referent, column, ondelete in foreign_keys:
+        op.drop_constraint(name, source, type_="foreignkey")
+        op.create_foreign_key(
+            name,
+            source,
+            referent,
+            [column],
+            ["id"],
+            ondelete=ondelete,
+            postgresql_not_valid=True,
+        )
+    with op.get_context().autocommit_block():
+        for name, source, *_ in foreign_keys:
+            op.execute(f'ALTER TABLE "{source}" VALIDATE CONSTRAINT "{name}"')
+
+
+def downgrade() -> None:
+    for name, source, referent, column, _ in foreign_keys:
+        op.drop_constraint(name, source, type_="foreignkey")
+        op.create_foreign_key(name, source, referent, [column], ["id"])
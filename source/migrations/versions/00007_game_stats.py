@@ -0,0 +1,34 @@
+"""game stats
+
+Revision ID: 00007
+Revises: 00006
+Create Date: 2026-10-19 12:07:00
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "00007"
+down_revision = "00006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "GameStats",
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("profiles", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("rooms", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("players", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("reconciled_at", sa.DateTime(), nullable=True),
+        sa.Column("reconciled_snapshot", sa.String(), nullable=True),
+        sa.Column("update_date", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["Games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("game_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("GameStats")
@@ -0,0 +1,47 @@
+import os
+from importlib.util import find_spec
+from math import ceil
+
+import uvicorn
+
+from source.core.settings import settings
+
+
+def available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as limit:
+            quota, period = limit.read().split()
+        if quota != "max":
+            cores = min(cores, max(1, ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cores
+
+
+def serve() -> None:
+    workers = 1 if settings.SERVER_RELOAD else settings.SERVER_WORKERS
+    workers = workers or available_cores()
+    uvicorn.run(
+        "source.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        reload=settings.SERVER_RELOAD,
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        limit_concurrency=settings.SERVER_MAX_CONCURRENCY,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS if workers > 1 else None,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN,
+        ws_ping_interval=settings.SERVER_WS_PING_INTERVAL,
+        ws_ping_timeout=settings.SERVER_WS_PING_TIMEOUT,
+    )
+
+
+if __name__ == "__main__":
+    serve()